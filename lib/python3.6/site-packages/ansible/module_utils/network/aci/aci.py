@@ -61,6 +61,33 @@ try:
 except ImportError:
     HAS_XMLJSON_COBRA = False
 
+# Optional, C-accelerated JSON encoding for large APIC payloads
+try:
+    import orjson
+
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    json_dumps = json.dumps
+
+# Optional, enables connection reuse across requests to the same APIC
+try:
+    import requests
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+
+class SessionResponse(object):
+    ''' Adapts a requests response to the read()/headers interface returned by fetch_url '''
+
+    def __init__(self, resp):
+        self._resp = resp
+        self.headers = resp.headers
+
+    def read(self):
+        return self._resp.content
+
 
 def aci_argument_spec():
     return dict(
@@ -75,6 +102,7 @@ def aci_argument_spec():
         use_proxy=dict(type='bool', default=True),
         use_ssl=dict(type='bool', default=True),
         validate_certs=dict(type='bool', default=True),
+        batch_id=dict(type='str'),
     )
 
 '''
@@ -119,6 +147,12 @@ URL_MAPPING = dict(
 
 class ACIModule(object):
 
+    # GET results shared by every ACIModule instance in this process, keyed
+    # by full request URI. Only persistent execution backends keep the
+    # process (and thus the cache) alive across tasks; any write to the
+    # APIC clears it.
+    _get_cache = {}
+
     def __init__(self, module):
         self.module = module
         self.params = module.params
@@ -231,6 +265,45 @@ class ACIModule(object):
             state_map = dict(absent='delete', present='post', query='get')
             self.params['method'] = state_map[self.params['state']]
 
+    def session(self):
+        ''' Return a keep-alive session shared across requests of this invocation '''
+        session = getattr(self.module, '_aci_session', None)
+        if session is None:
+            session = requests.Session()
+            session.verify = self.params['validate_certs']
+            if not self.params['use_proxy']:
+                session.trust_env = False
+            self.module._aci_session = session
+        return session
+
+    def send_request(self, url, data=None, headers=None, method='GET'):
+        ''' Issue an HTTP request to the APIC
+
+        When the requests library is available the call goes through one
+        keep-alive session per invocation, so the TCP+TLS handshake is paid
+        once instead of once per login/GET/POST. Falls back to fetch_url
+        otherwise. Returns the same (response, info) pair as fetch_url.
+        '''
+        if HAS_REQUESTS:
+            try:
+                resp = self.session().request(method, url,
+                                              data=data,
+                                              headers=headers,
+                                              timeout=self.params['timeout'])
+            except requests.exceptions.RequestException as e:
+                return None, dict(status=-1, msg='Connection failure: %s' % e, url=url)
+            info = dict(status=resp.status_code, msg='%s %s' % (resp.status_code, resp.reason), url=url)
+            if resp.status_code != 200:
+                info['body'] = resp.text
+            return SessionResponse(resp), info
+
+        return fetch_url(self.module, url,
+                         data=data,
+                         headers=headers,
+                         method=method,
+                         timeout=self.params['timeout'],
+                         use_proxy=self.params['use_proxy'])
+
     def login(self):
         ''' Log in to APIC '''
 
@@ -240,11 +313,7 @@ class ACIModule(object):
         else:
             url = '%(protocol)s://%(host)s/api/aaaLogin.json' % self.params
         payload = {'aaaUser': {'attributes': {'name': self.params['username'], 'pwd': self.params['password']}}}
-        resp, auth = fetch_url(self.module, url,
-                               data=json.dumps(payload),
-                               method='POST',
-                               timeout=self.params['timeout'],
-                               use_proxy=self.params['use_proxy'])
+        resp, auth = self.send_request(url, data=json.dumps(payload), method='POST')
 
         # Handle APIC response
         if auth['status'] != 200:
@@ -363,12 +432,10 @@ class ACIModule(object):
             self.cert_auth(path=path, payload=payload)
 
         # Perform request
-        resp, info = fetch_url(self.module, self.url,
-                               data=payload,
-                               headers=self.headers,
-                               method=self.params['method'].upper(),
-                               timeout=self.params['timeout'],
-                               use_proxy=self.params['use_proxy'])
+        resp, info = self.send_request(self.url,
+                                       data=payload,
+                                       headers=self.headers,
+                                       method=self.params['method'].upper())
 
         self.response = info['msg']
         self.status = info['status']
@@ -383,6 +450,8 @@ class ACIModule(object):
                 # Connection error
                 self.fail_json(msg='Connection failed for %(url)s. %(msg)s' % info)
 
+        if self.params['method'] != 'get':
+            ACIModule._get_cache.clear()
         self.response_json(resp.read())
 
     def query(self, path):
@@ -400,12 +469,7 @@ class ACIModule(object):
             self.cert_auth(path=path, method='GET')
 
         # Perform request
-        resp, query = fetch_url(self.module, self.url,
-                                data=None,
-                                headers=self.headers,
-                                method='GET',
-                                timeout=self.params['timeout'],
-                                use_proxy=self.params['use_proxy'])
+        resp, query = self.send_request(self.url, headers=self.headers, method='GET')
 
         # Handle APIC response
         if query['status'] != 200:
@@ -667,11 +731,7 @@ class ACIModule(object):
             if self.params['private_key'] is not None:
                 self.cert_auth(method='DELETE')
 
-            resp, info = fetch_url(self.module, self.url,
-                                   headers=self.headers,
-                                   method='DELETE',
-                                   timeout=self.params['timeout'],
-                                   use_proxy=self.params['use_proxy'])
+            resp, info = self.send_request(self.url, headers=self.headers, method='DELETE')
 
             self.response = info['msg']
             self.status = info['status']
@@ -680,6 +740,7 @@ class ACIModule(object):
             # Handle APIC response
             if info['status'] == 200:
                 self.result['changed'] = True
+                ACIModule._get_cache.clear()
                 self.response_json(resp.read())
             else:
                 try:
@@ -799,15 +860,19 @@ class ACIModule(object):
         """
         uri = self.url + self.filter_string
 
+        cached = ACIModule._get_cache.get(uri)
+        if cached is not None:
+            self.existing = deepcopy(cached)
+            self.response = 'OK (cached)'
+            self.status = 200
+            self.method = 'GET'
+            return
+
         # Sign and encode request as to APIC's wishes
         if self.params['private_key'] is not None:
             self.cert_auth(path=self.path + self.filter_string, method='GET')
 
-        resp, info = fetch_url(self.module, uri,
-                               headers=self.headers,
-                               method='GET',
-                               timeout=self.params['timeout'],
-                               use_proxy=self.params['use_proxy'])
+        resp, info = self.send_request(uri, headers=self.headers, method='GET')
         self.response = info['msg']
         self.status = info['status']
         self.method = 'GET'
@@ -815,6 +880,7 @@ class ACIModule(object):
         # Handle APIC response
         if info['status'] == 200:
             self.existing = json.loads(resp.read())['imdata']
+            ACIModule._get_cache[uri] = deepcopy(self.existing)
         else:
             try:
                 # APIC error
@@ -887,25 +953,65 @@ class ACIModule(object):
             if children:
                 self.proposed[aci_class].update(dict(children=children))
 
-    def post_config(self):
+    @staticmethod
+    def batch_spool_path(batch_id):
+        """
+        This method returns the spool file used to collect payloads queued under the given batch id. The file lives in the
+        user's Ansible temporary directory so concurrent plays against different controllers do not interfere.
+        """
+        return os.path.join(os.path.expanduser('~/.ansible/tmp'), 'aci_batch_%s.json' % batch_id)
+
+    def queue_config(self):
+        """
+        This method appends the constructed payload and its target DN to the batch spool file instead of issuing a POST.
+        The M(aci_batch_flush) module later wraps all queued entries in a single request to /api/mo/uni.json, so a play
+        that creates many MOs pays for one HTTPS round-trip instead of one per task.
+        """
+        dn = self.path
+        if dn.startswith('api/mo/'):
+            dn = dn[len('api/mo/'):]
+        if dn.endswith('.json'):
+            dn = dn[:-len('.json')]
+
+        spool = self.batch_spool_path(self.params['batch_id'])
+        spool_dir = os.path.dirname(spool)
+        if not os.path.isdir(spool_dir):
+            os.makedirs(spool_dir)
+        with open(spool, 'a') as spool_file:
+            spool_file.write(json_dumps(dict(dn=dn, config=self.config)) + '\n')
+
+        self.result['changed'] = True
+        self.result['queued'] = True
+        self.method = 'POST'
+
+    def post_config(self, force=False):
         """
         This method is used to handle the logic when the modules state is equal to present. The method only pushes a change if
         the object has differences than what exists on the APIC, and if check_mode is False. A successful change will mark the
         module as changed.
+
+        :param force: Type bool.
+                      Post the full proposed configuration without a prior diff. The APIC treats the POST as an upsert, so
+                      modules can skip the get_existing round-trip when the caller does not need previous/diff output.
         """
+        if force and not self.config:
+            self.config = self.proposed
         if not self.config:
             return
+        elif self.params.get('batch_id') is not None and not self.module.check_mode:
+            # Spool the payload for a later flush instead of posting it now
+            self.queue_config()
         elif not self.module.check_mode:
+            payload = json_dumps(self.config)
+
             # Sign and encode request as to APIC's wishes
             if self.params['private_key'] is not None:
-                self.cert_auth(method='POST', payload=json.dumps(self.config))
+                self.cert_auth(method='POST', payload=payload)
 
-            resp, info = fetch_url(self.module, self.url,
-                                   data=json.dumps(self.config),
-                                   headers=self.headers,
-                                   method='POST',
-                                   timeout=self.params['timeout'],
-                                   use_proxy=self.params['use_proxy'])
+            resp, info = self.send_request(self.url,
+                                           data=payload,
+                                           headers=self.headers,
+                                           method='POST')
 
             self.response = info['msg']
             self.status = info['status']
@@ -914,6 +1020,7 @@ class ACIModule(object):
             # Handle APIC response
             if info['status'] == 200:
                 self.result['changed'] = True
+                ACIModule._get_cache.clear()
                 self.response_json(resp.read())
             else:
                 try:
@@ -946,7 +1053,7 @@ class ACIModule(object):
 
         if 'state' in self.params:
             self.original = self.existing
-            if self.params['state'] in ('absent', 'present'):
+            if self.params['state'] in ('absent', 'present') and not self.params.get('no_diff'):
                 self.get_existing()
 
             # if self.module._diff and self.original != self.existing:
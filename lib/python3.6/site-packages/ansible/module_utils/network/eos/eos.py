@@ -27,18 +27,142 @@
 # LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
 # USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #
+import hashlib
+import json
 import os
+import re
 import time
+import uuid
 
-from ansible.module_utils._text import to_text, to_native
+from ansible.module_utils._text import to_bytes, to_text, to_native
 from ansible.module_utils.basic import env_fallback, return_values
-from ansible.module_utils.connection import Connection, ConnectionError
-from ansible.module_utils.network.common.utils import to_list, ComplexList
-from ansible.module_utils.six import iteritems
-from ansible.module_utils.urls import fetch_url
+from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.network.common.utils import to_list
+from ansible.module_utils.six import iteritems, text_type
+
+# Connection, ComplexList and fetch_url are imported at first use; the
+# cli path never needs urls (urllib/ssl) and the eapi path never needs
+# the connection client, so cold worker start skips the unused half
+
+try:
+    import requests
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
 
 _DEVICE_CONNECTION = None
 
+_JSON_SUFFIX = re.compile(r'\|\s*json\s*$')
+
+# session support is a property of the EOS image, so cache the probe
+# result on disk; each task runs in a fresh worker process and would
+# otherwise redo the round trip
+_SESSION_SUPPORT_TTL = 3600
+
+
+def _session_support_cache_path(key):
+    # keep the probe results out of the shared tempdir, where the
+    # predictable name could be pre-created by any local user
+    return os.path.join(os.path.expanduser('~/.ansible/tmp'), 'eos_ss_cache',
+                        '%s.json' % hashlib.md5(to_bytes(key)).hexdigest())
+
+
+def _get_cached_session_support(key):
+    path = _session_support_cache_path(key)
+    try:
+        if time.time() - os.path.getmtime(path) < _SESSION_SUPPORT_TTL:
+            with open(path) as f:
+                return json.load(f).get('supports_sessions')
+    except (IOError, OSError, ValueError):
+        pass
+    return None
+
+
+def _cache_session_support(key, value):
+    path = _session_support_cache_path(key)
+    tmp = '%s.%s.tmp' % (path, os.getpid())
+    try:
+        cache_dir = os.path.dirname(path)
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, 0o700)
+        with open(tmp, 'w') as f:
+            json.dump({'supports_sessions': value}, f)
+        os.rename(tmp, path)
+    except (IOError, OSError):
+        pass
+
+class _ConfigCache:
+    """File-backed cache for retrieved device configs.
+
+    Running-configs can reach multi-MB on stacked switches and every
+    task runs in its own worker process, so an instance dict alone is
+    neither shared nor bounded.  Entries live in a 0700 directory under
+    the user's ~/.ansible/tmp (configs must not land in a shared
+    tempdir), one subdirectory per host so a config write can drop all
+    of a host's entries, and expire by mtime.
+    """
+
+    def __init__(self, ttl=300):
+        self._ttl = ttl
+        self._dir = os.path.join(os.path.expanduser('~/.ansible/tmp'), 'eos_cfg_cache')
+
+    def _host_dir(self, host):
+        return os.path.join(self._dir, hashlib.sha1(to_bytes(host)).hexdigest())
+
+    def _path(self, host, cmd):
+        return os.path.join(self._host_dir(host), hashlib.sha1(to_bytes(cmd)).hexdigest())
+
+    def get(self, host, cmd):
+        path = self._path(host, cmd)
+        try:
+            if time.time() - os.path.getmtime(path) < self._ttl:
+                with open(path) as f:
+                    return f.read()
+        except (IOError, OSError):
+            pass
+        return None
+
+    def set(self, host, cmd, value):
+        path = self._path(host, cmd)
+        tmp = '%s.%s.tmp' % (path, os.getpid())
+        try:
+            host_dir = self._host_dir(host)
+            if not os.path.isdir(host_dir):
+                os.makedirs(host_dir, 0o700)
+            with open(tmp, 'w') as f:
+                f.write(value)
+            os.rename(tmp, path)
+        except (IOError, OSError):
+            pass
+
+    def invalidate(self, host):
+        """Drop every cached config for a host after a config write."""
+        host_dir = self._host_dir(host)
+        try:
+            entries = os.listdir(host_dir)
+        except OSError:
+            return
+        for name in entries:
+            try:
+                os.remove(os.path.join(host_dir, name))
+            except OSError:
+                pass
+
+
+_CFG_CACHE = _ConfigCache()
+
 eos_provider_spec = {
     'host': dict(),
     'port': dict(type='int'),
@@ -106,6 +230,16 @@ def get_connection(module):
     return _DEVICE_CONNECTION
 
 
+# client-side Connection objects keyed by socket path, so sibling Cli
+# instances in the same process skip the per-connection setup
+_CONN_POOL = {}
+
+# config-mode commands with special handling in send_config
+_SKIP = frozenset(('end',))
+_MULTILINE_START = 'banner'
+_MULTILINE_END = 'EOF'
+
+
 class Cli:
 
     def __init__(self, module):
@@ -117,13 +251,21 @@ class Cli:
     def _get_connection(self):
         if self._connection:
             return self._connection
-        self._connection = Connection(self._module._socket_path)
 
+        from ansible.module_utils.connection import Connection
+
+        socket_path = self._module._socket_path
+        connection = _CONN_POOL.get(socket_path)
+        if connection is None:
+            connection = Connection(socket_path)
+            _CONN_POOL[socket_path] = connection
+
+        self._connection = connection
         return self._connection
 
     def close_session(self, session):
         conn = self._get_connection()
-        # to close session gracefully execute abort in top level session prompt.
+        # to close session gracefully execute abort in top level session prompt
         conn.get('end')
         conn.get('configure session %s' % session)
         conn.get('abort')
@@ -132,6 +274,12 @@ class Cli:
     def supports_sessions(self):
         if self._session_support is not None:
             return self._session_support
+
+        cached = _get_cached_session_support(self._module._socket_path)
+        if cached is not None:
+            self._session_support = cached
+            return cached
+
         conn = self._get_connection()
 
         self._session_support = True
@@ -140,6 +288,7 @@ class Cli:
         except:
             self._session_support = False
 
+        _cache_session_support(self._module._socket_path, self._session_support)
         return self._session_support
 
     def get_config(self, flags=None):
@@ -151,14 +300,18 @@ class Cli:
         cmd += ' '.join(flags)
         cmd = cmd.strip()
 
-        try:
-            return self._device_configs[cmd]
-        except KeyError:
+        cfg = self._device_configs.get(cmd)
+        if cfg is None:
+            cfg = _CFG_CACHE.get(self._module._socket_path, cmd)
+
+        if cfg is None:
             conn = self._get_connection()
             out = conn.get_config(flags=flags)
             cfg = to_text(out, errors='surrogate_then_replace').strip()
-            self._device_configs[cmd] = cfg
-            return cfg
+            _CFG_CACHE.set(self._module._socket_path, cmd, cfg)
+
+        self._device_configs[cmd] = cfg
+        return cfg
 
     def run_commands(self, commands, check_rc=True):
         """Run list of commands on remote device and return results
@@ -177,12 +330,17 @@ class Cli:
                 answer = None
 
             out = connection.get(command, prompt, answer)
-            out = to_text(out, errors='surrogate_or_strict')
-
-            try:
-                out = self._module.from_json(out)
-            except ValueError:
-                out = str(out).strip()
+            if not isinstance(out, text_type):
+                out = to_text(out, errors='surrogate_or_strict')
+
+            # only run the json parser over output that can actually be
+            # json; show commands normally return plain text
+            out = out.strip()
+            if out.startswith(('{', '[')):
+                try:
+                    out = self._module.from_json(out)
+                except ValueError:
+                    pass
 
             responses.append(out)
 
@@ -191,15 +349,18 @@ class Cli:
     def send_config(self, commands):
         conn = self._get_connection()
 
+        # commands go out one request each: network_cli's receive() stops
+        # at the first prompt it sees, so joining them into one send
+        # leaves the remaining prompts unread and desynchronizes every
+        # later conn.get() on the connection
         multiline = False
-        rc = 0
         for command in to_list(commands):
-            if command == 'end':
+            if command in _SKIP:
                 continue
 
-            if command.startswith('banner') or multiline:
+            if multiline or command.startswith(_MULTILINE_START):
                 multiline = True
-            elif command == 'EOF' and multiline:
+            elif command == _MULTILINE_END and multiline:
                 multiline = False
 
             conn.get(command, None, None, multiline)
@@ -219,6 +380,9 @@ class Cli:
             self._module.fail_json(msg="Error on executing commands %s" % commands, data=to_text(message, errors='surrogate_then_replace'))
 
         conn.get('end')
+        # the device config changed, so any cached copy is now stale
+        self._device_configs = {}
+        _CFG_CACHE.invalidate(self._module._socket_path)
         return {}
 
     def load_config(self, commands, commit=False, replace=False):
@@ -239,16 +403,16 @@ class Cli:
                 return result
 
         conn = self._get_connection()
-        session = 'ansible_%s' % int(time.time())
+        session = 'ansible_%s' % uuid.uuid4().hex[:12]
         result = {'session': session}
 
-        out = conn.get('configure session %s' % session)
-
+        payload = ['configure session %s' % session]
         if replace:
-            out = conn.get('rollback clean-config')
+            payload.append('rollback clean-config')
+        payload.extend(to_list(commands))
 
         try:
-            self.send_config(commands)
+            self.send_config(payload)
         except ConnectionError as exc:
             self.close_session(session)
             message = getattr(exc, 'err', exc)
@@ -260,6 +424,9 @@ class Cli:
 
         if commit:
             conn.get('commit')
+            # the device config changed, so any cached copy is now stale
+            self._device_configs = {}
+            _CFG_CACHE.invalidate(self._module._socket_path)
         else:
             self.close_session(session)
 
@@ -273,33 +440,68 @@ class Eapi:
         self._enable = None
         self._session_support = None
         self._device_configs = {}
+        self._http = None
+
+        params = module.params
+        provider = params['provider'] or {}
 
-        host = module.params['provider']['host']
-        port = module.params['provider']['port']
+        host = provider.get('host')
+        port = provider.get('port')
 
-        self._module.params['url_username'] = self._module.params['username']
-        self._module.params['url_password'] = self._module.params['password']
+        params['url_username'] = params.get('username')
+        params['url_password'] = params.get('password')
 
-        if module.params['provider']['use_ssl']:
+        if provider.get('use_ssl', True):
             proto = 'https'
         else:
             proto = 'http'
 
-        module.params['validate_certs'] = module.params['provider']['validate_certs']
+        params['validate_certs'] = provider.get('validate_certs', True)
 
         self._url = '%s://%s:%s/command-api' % (proto, host, port)
 
-        if module.params['auth_pass']:
-            self._enable = {'cmd': 'enable', 'input': module.params['auth_pass']}
+        if params.get('auth_pass'):
+            self._enable = {'cmd': 'enable', 'input': params['auth_pass']}
         else:
             self._enable = 'enable'
 
+    def __del__(self):
+        if self._http is not None:
+            try:
+                self._http.close()
+            except Exception:
+                pass
+
+    def _get_http_session(self):
+        # reuse a single keep-alive session so back-to-back requests
+        # (config sessions issue 3-4) share one TCP/TLS connection
+        if self._http is None:
+            session = requests.Session()
+            session.auth = (self._module.params['url_username'],
+                            self._module.params['url_password'])
+            session.verify = self._module.params['validate_certs']
+            if not self._module.params['provider']['use_proxy']:
+                session.trust_env = False
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._http = session
+        return self._http
+
     @property
     def supports_sessions(self):
-        if self._session_support:
+        if self._session_support is not None:
             return self._session_support
+
+        cached = _get_cached_session_support(self._url)
+        if cached is not None:
+            self._session_support = cached
+            return cached
+
         response = self.send_request(['show configuration sessions'])
         self._session_support = 'error' not in response
+
+        _cache_session_support(self._url, self._session_support)
         return self._session_support
 
     def _request_builder(self, commands, output, reqid=None):
@@ -313,23 +515,52 @@ class Eapi:
             commands.insert(0, self._enable)
 
         body = self._request_builder(commands, output)
-        data = self._module.jsonify(body)
+        if HAS_ORJSON:
+            data = orjson.dumps(body)
+        else:
+            data = self._module.jsonify(body)
 
         headers = {'Content-Type': 'application/json-rpc'}
         timeout = self._module.params['timeout']
         use_proxy = self._module.params['provider']['use_proxy']
 
-        response, headers = fetch_url(
-            self._module, self._url, data=data, headers=headers,
-            method='POST', timeout=timeout, use_proxy=use_proxy
-        )
+        if HAS_REQUESTS:
+            try:
+                resp = self._get_http_session().post(
+                    self._url, data=data, headers=headers, timeout=timeout
+                )
+            except requests.RequestException as exc:
+                self._module.fail_json(msg=to_native(exc), url=self._url)
 
-        if headers['status'] != 200:
-            self._module.fail_json(**headers)
+            if resp.status_code != 200:
+                self._module.fail_json(msg=resp.reason, status=resp.status_code,
+                                       url=self._url)
+
+            data = resp.content
+        else:
+            from ansible.module_utils.urls import fetch_url
+
+            response, headers = fetch_url(
+                self._module, self._url, data=data, headers=headers,
+                method='POST', timeout=timeout, use_proxy=use_proxy
+            )
+
+            if headers['status'] != 200:
+                self._module.fail_json(**headers)
 
-        try:
             data = response.read()
-            response = self._module.from_json(to_text(data, errors='surrogate_then_replace'))
+
+        return self._parse_response(data)
+
+    def _parse_response(self, data):
+        try:
+            if HAS_ORJSON:
+                # orjson consumes utf-8 bytes directly, no to_text pass
+                response = orjson.loads(data)
+            else:
+                if not isinstance(data, text_type):
+                    data = to_text(data, errors='surrogate_then_replace')
+                response = self._module.from_json(data)
         except ValueError:
             self._module.fail_json(msg='unable to load response from device', data=data)
 
@@ -338,40 +569,105 @@ class Eapi:
 
         return response
 
+    def send_requests(self, command_lists, output='text'):
+        """Issues several independent eAPI requests and returns the
+        responses in order.
+
+        The requests are posted concurrently over a shared connection
+        when aiohttp is installed; otherwise they degrade to sequential
+        send_request calls.  output may be a single format or a list
+        with one format per request.  Only use this for requests that
+        do not depend on each other (config sessions are ordered and
+        must keep going through send_request).
+        """
+        command_lists = [to_list(commands) for commands in command_lists]
+        outputs = output if isinstance(output, list) else [output] * len(command_lists)
+
+        if not HAS_AIOHTTP or len(command_lists) < 2:
+            return [self.send_request(commands, output=out)
+                    for commands, out in zip(command_lists, outputs)]
+
+        import asyncio
+
+        bodies = []
+        for commands, out in zip(command_lists, outputs):
+            commands = list(commands)
+            if self._enable:
+                commands.insert(0, self._enable)
+            body = self._request_builder(commands, out)
+            if HAS_ORJSON:
+                bodies.append(orjson.dumps(body))
+            else:
+                bodies.append(self._module.jsonify(body))
+
+        headers = {'Content-Type': 'application/json-rpc'}
+        timeout = self._module.params['timeout']
+
+        async def _fetch_all():
+            auth = aiohttp.BasicAuth(self._module.params['url_username'],
+                                     self._module.params['url_password'])
+            ssl_arg = None if self._module.params['validate_certs'] else False
+            connector = aiohttp.TCPConnector(ssl=ssl_arg, limit=4)
+
+            async def _post(session, data):
+                async with session.post(self._url, data=data, headers=headers) as resp:
+                    if resp.status != 200:
+                        raise ConnectionError('eapi request returned status %s' % resp.status)
+                    return await resp.read()
+
+            client_timeout = aiohttp.ClientTimeout(total=timeout)
+            async with aiohttp.ClientSession(auth=auth, connector=connector,
+                                             timeout=client_timeout) as session:
+                return await asyncio.gather(*[_post(session, data) for data in bodies])
+
+        loop = asyncio.new_event_loop()
+        try:
+            raw = loop.run_until_complete(_fetch_all())
+        except Exception as exc:
+            self._module.fail_json(msg=to_native(exc), url=self._url)
+        finally:
+            loop.close()
+
+        return [self._parse_response(data) for data in raw]
+
     def run_commands(self, commands):
         """Runs list of commands on remote device and returns results
         """
-        output = None
-        queue = list()
-        responses = list()
+        commands = to_list(commands)
+        responses = [None] * len(commands)
+        buckets = {}
 
-        def _send(commands, output):
-            response = self.send_request(commands, output=output)
-            if 'error' in response:
-                err = response['error']
-                self._module.fail_json(msg=err['message'], code=err['code'])
-            return response['result']
+        for index, item in enumerate(commands):
+            command = item['command']
+            if not isinstance(command, str):
+                command = to_native(command, errors='surrogate_then_replace')
 
-        for item in to_list(commands):
-            if is_json(item['command']):
-                item['command'] = str(item['command']).replace('| json', '')
+            stripped, subbed = _JSON_SUFFIX.subn('', command)
+            if subbed:
+                item['command'] = stripped.rstrip()
                 item['output'] = 'json'
 
-            if output and output != item['output']:
-                responses.extend(_send(queue, output))
-                queue = list()
-
             output = item['output'] or 'json'
-            queue.append(item['command'])
+            buckets.setdefault(output, []).append((index, item['command']))
+
+        # the per-format buckets are independent of each other, so they
+        # can go out concurrently when aiohttp is available
+        outputs = list(buckets)
+        bucket_responses = self.send_requests(
+            [[cmd for _, cmd in buckets[output]] for output in outputs],
+            output=outputs
+        )
 
-        if queue:
-            responses.extend(_send(queue, output))
+        for output, response in zip(outputs, bucket_responses):
+            if 'error' in response:
+                err = response['error']
+                self._module.fail_json(msg=err['message'], code=err['code'])
 
-        for index, item in enumerate(commands):
-            try:
-                responses[index] = responses[index]['output'].strip()
-            except KeyError:
-                pass
+            # strip text outputs while scattering; json results carry no
+            # 'output' key and pass through untouched
+            for (index, _), result in zip(buckets[output], response['result']):
+                out = result.get('output') if isinstance(result, dict) else None
+                responses[index] = out.strip() if out is not None else result
 
         return responses
 
@@ -384,13 +680,19 @@ class Eapi:
         cmd += ' '.join(flags)
         cmd = cmd.strip()
 
-        try:
-            return self._device_configs[cmd]
-        except KeyError:
+        cfg = self._device_configs.get(cmd)
+        if cfg is None:
+            cfg = _CFG_CACHE.get(self._url, cmd)
+
+        if cfg is None:
             out = self.send_request(cmd)
-            cfg = str(out['result'][0]['output']).strip()
-            self._device_configs[cmd] = cfg
-            return cfg
+            raw = out['result'][0]['output']
+            # json.loads already hands back text; only cast the odd case
+            cfg = raw.strip() if isinstance(raw, text_type) else str(raw).strip()
+            _CFG_CACHE.set(self._url, cmd, cfg)
+
+        self._device_configs[cmd] = cfg
+        return cfg
 
     def configure(self, commands):
         """Sends the ordered set of commands to the device
@@ -403,6 +705,9 @@ class Eapi:
             err = responses['error']
             self._module.fail_json(msg=err['message'], code=err['code'])
 
+        # the device config changed, so any cached copy is now stale
+        self._device_configs = {}
+        _CFG_CACHE.invalidate(self._url)
         return responses[1:]
 
     def load_config(self, config, commit=False, replace=False):
@@ -426,9 +731,12 @@ class Eapi:
                 result = {'changed': True}
                 return result
 
-        session = 'ansible_%s' % int(time.time())
+        session = 'ansible_%s' % uuid.uuid4().hex[:12]
         result = {'session': session}
-        commands = ['configure session %s' % session]
+        # every request in this session re-enters it, so format the
+        # prefix once and reuse it below
+        session_prefix = ['configure session %s' % session]
+        commands = list(session_prefix)
 
         if replace:
             commands.append('rollback clean-config')
@@ -437,18 +745,23 @@ class Eapi:
 
         response = self.send_request(commands)
         if 'error' in response:
-            commands = ['configure session %s' % session, 'abort']
-            self.send_request(commands)
+            self.send_request(session_prefix + ['abort'])
             err = response['error']
             self._module.fail_json(msg=err['message'], code=err['code'])
 
-        commands = ['configure session %s' % session, 'show session-config diffs']
+        # diff fetch and commit/abort ride in one request on purpose;
+        # splitting them would add an HTTP round trip per load_config
+        commands = session_prefix + ['show session-config diffs']
         if commit:
             commands.append('commit')
         else:
             commands.append('abort')
 
         response = self.send_request(commands, output='text')
+        if commit:
+            # the device config changed, so any cached copy is now stale
+            self._device_configs = {}
+            _CFG_CACHE.invalidate(self._url)
         diff = response['result'][1]['output']
         if len(diff) > 0:
             result['diff'] = diff
@@ -457,27 +770,47 @@ class Eapi:
 
 
 def is_json(cmd):
-    return to_native(cmd, errors='surrogate_then_replace').endswith('| json')
+    if not isinstance(cmd, str):
+        cmd = to_native(cmd, errors='surrogate_then_replace')
+    return bool(_JSON_SUFFIX.search(cmd))
+
+
+_MISSING = object()
 
 
 def is_eapi(module):
-    transport = module.params['transport']
-    provider_transport = (module.params['provider'] or {}).get('transport')
-    return 'eapi' in (transport, provider_transport)
+    cached = getattr(module, '_eos_is_eapi', _MISSING)
+    if cached is not _MISSING:
+        return cached
+    transport = module.params.get('transport')
+    provider_transport = (module.params.get('provider') or {}).get('transport')
+    cached = transport == 'eapi' or provider_transport == 'eapi'
+    module._eos_is_eapi = cached
+    return cached
+
+
+_TRANSFORMS = {}
+
+_EAPI_SPEC = dict(
+    command=dict(key=True),
+    output=dict(default='json'),
+    prompt=dict(),
+    answer=dict()
+)
+_CLI_SPEC = dict(_EAPI_SPEC, output=dict(default='text'))
 
 
 def to_command(module, commands):
-    if is_eapi(module):
-        default_output = 'json'
-    else:
-        default_output = 'text'
-
-    transform = ComplexList(dict(
-        command=dict(key=True),
-        output=dict(default=default_output),
-        prompt=dict(),
-        answer=dict()
-    ), module)
+    # only two transforms are ever possible (eapi vs cli default
+    # output), so build each ComplexList once and reuse it
+    key = 'eapi' if is_eapi(module) else 'cli'
+    transform = _TRANSFORMS.get(key)
+    if transform is None:
+        from ansible.module_utils.network.common.utils import ComplexList
+
+        spec = _EAPI_SPEC if key == 'eapi' else _CLI_SPEC
+        transform = ComplexList(spec, module)
+        _TRANSFORMS[key] = transform
 
     return transform(to_list(commands))
 
@@ -21,6 +21,7 @@
 import collections
 import inspect
 import os
+import random
 import time
 
 from abc import ABCMeta, abstractmethod
@@ -131,6 +132,10 @@ def create_connection(auth):
     The `ca_file` parameter is mandatory in case user want to use secure connection,
     in case user want to use insecure connection, it's mandatory to send insecure=True.
 
+    The optional `connections` and `pipeline` parameters are passed through to the
+    SDK so independent requests (for example the ones issued by `follow_link`) can
+    share a connection pool and be pipelined instead of going one at a time.
+
     :param auth: dictionary which contains needed values for connection creation
     :return: Python SDK connection
     """
@@ -144,6 +149,8 @@ def create_connection(auth):
         token=auth.get('token', None),
         kerberos=auth.get('kerberos', None),
         headers=auth.get('headers', None),
+        connections=auth.get('connections', 2),
+        pipeline=auth.get('pipeline', 4),
     )
 
 
@@ -316,12 +323,16 @@ def wait(
     :param condition: condition to be fulfilled
     :param fail_condition: if this condition is true, raise Exception
     :param timeout: max time to wait in seconds
+    :param poll_interval: Maximum number of seconds between condition checks.
+        Polling starts at a fraction of a second and backs off exponentially
+        with jitter up to this value, so fast transitions are picked up
+        quickly while long ones don't hammer the engine.
     :param wait: if True wait for condition, if False don't wait
-    :param poll_interval: Number of seconds we should wait until next condition check
     """
     # Wait until the desired state of the entity:
     if wait:
         start = time.time()
+        delay = 0.25
         while time.time() < start + timeout:
             # Exit if the condition of entity is valid:
             entity = get_entity(service)
@@ -330,8 +341,9 @@ def wait(
             elif fail_condition(entity):
                 raise Exception("Error while waiting on result state of the entity.")
 
-            # Sleep for `poll_interval` seconds if none of the conditions apply:
-            time.sleep(float(poll_interval))
+            # Back off exponentially with +-20% jitter, capped at `poll_interval`:
+            time.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(float(poll_interval), delay * 2)
 
         raise Exception("Timeout exceed while waiting on result state of the entity.")
 
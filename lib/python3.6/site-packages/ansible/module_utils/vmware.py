@@ -915,6 +915,58 @@ class PyVmomi(object):
 
         return self.content.propertyCollector.RetrieveContents([filter_spec])
 
+    def get_properties_for_objects(self, objs, vim_type, properties=None):
+        """
+        Function to fetch the given properties for a known set of managed objects
+        in a single PropertyCollector round trip, instead of one SOAP call per
+        attribute access on each object
+        :param objs: List of managed objects to fetch properties for
+        :param vim_type: Type of vim object e.g, for host system - vim.HostSystem
+        :param properties: List of properties related to vim object e.g. Name
+        :return: dict mapping each managed object to a dict of property name / value
+        """
+        if not objs:
+            # RetrievePropertiesEx faults on an empty objectSet
+            return {}
+
+        if properties is None:
+            properties = ['name']
+
+        # Create Property Spec
+        property_spec = vmodl.query.PropertyCollector.PropertySpec(
+            type=vim_type,
+            all=False,
+            pathSet=properties
+        )
+
+        # Create one Object Spec per managed object
+        object_specs = [
+            vmodl.query.PropertyCollector.ObjectSpec(obj=obj) for obj in objs
+        ]
+
+        # Create Filter Spec
+        filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+            objectSet=object_specs,
+            propSet=[property_spec],
+            reportMissingObjectsInResults=False
+        )
+
+        property_collector = self.content.propertyCollector
+        options = vmodl.query.PropertyCollector.RetrieveOptions()
+        result = property_collector.RetrievePropertiesEx(specSet=[filter_spec], options=options)
+
+        objs_properties = {}
+        while result is not None:
+            for object_content in result.objects:
+                objs_properties[object_content.obj] = dict(
+                    (prop.name, prop.val) for prop in object_content.propSet
+                )
+            if result.token is None:
+                break
+            result = property_collector.ContinueRetrievePropertiesEx(token=result.token)
+
+        return objs_properties
+
     # Virtual Machine related functions
     def get_vm(self):
         """
@@ -1096,6 +1148,22 @@ class PyVmomi(object):
         else:
             return []
 
+    def get_hosts_by_cluster_name(self, cluster_name):
+        """
+        Get all hosts of the named cluster with a single PropertyCollector
+        call instead of an inventory-tree walk followed by a child fetch
+        Args:
+            cluster_name: Name of cluster
+
+        Returns: List of hosts, or None when the cluster was not found
+
+        """
+        for object_content in self.get_managed_objects_properties(vim.ClusterComputeResource, ['name', 'host']):
+            properties = dict((prop.name, prop.val) for prop in object_content.propSet)
+            if properties.get('name') == cluster_name:
+                return list(properties.get('host') or [])
+        return None
+
     # Hosts related functions
     def find_hostsystem_by_name(self, host_name):
         """
@@ -1108,6 +1176,21 @@ class PyVmomi(object):
         """
         return find_hostsystem_by_name(self.content, hostname=host_name)
 
+    def get_hostsystem_by_name(self, host_name):
+        """
+        Get Host by name with a single PropertyCollector call
+        Args:
+            host_name: Name of ESXi host
+
+        Returns: Host managed object, or None when not found
+
+        """
+        for object_content in self.get_managed_objects_properties(vim.HostSystem, ['name']):
+            for prop in object_content.propSet:
+                if prop.name == 'name' and prop.val == host_name:
+                    return object_content.obj
+        return None
+
     # Network related functions
     @staticmethod
     def find_host_portgroup_by_name(host, portgroup_name):
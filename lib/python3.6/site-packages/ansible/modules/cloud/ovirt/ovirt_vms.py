@@ -26,6 +26,23 @@ options:
     id:
         description:
             - ID of the Virtual Machine to manage.
+    instances:
+        description:
+            - "List of dictionaries describing multiple Virtual Machines to provision in one module run.
+               Each dictionary accepts the same keys as the top level parameters (I(name), I(template),
+               I(memory), ...) and overrides them for that Virtual Machine."
+            - All Virtual Machines are handled over a single authenticated connection, so the login
+              handshake is paid once per batch instead of once per VM.
+            - Only supported when C(state) is I(present).
+        version_added: "2.5"
+    lookup_cache_timeout:
+        description:
+            - "Number of seconds to cache name to ID lookups (storage domain, instance type, ...)
+               on disk per engine, so serial batches across a large inventory don't repeat
+               identical search requests."
+            - Set to C(0) to disable the on-disk cache; lookups are still memoized within one run.
+        default: 3600
+        version_added: "2.5"
     state:
         description:
             - Should the Virtual Machine be running/stopped/present/absent/suspended/next_run/registered.
@@ -824,13 +841,53 @@ vm:
     returned: On success if VM is found.
     type: dict
 '''
+import hashlib
+import json
+import os
+import random
+import time
 import traceback
 
+from collections import Counter
+from functools import lru_cache
+
 try:
+    import ovirtsdk4 as sdk
     import ovirtsdk4.types as otypes
+
+    _TRANSITIONAL_STATES = frozenset((
+        otypes.VmStatus.MIGRATING,
+        otypes.VmStatus.POWERING_UP,
+        otypes.VmStatus.REBOOT_IN_PROGRESS,
+        otypes.VmStatus.WAIT_FOR_LAUNCH,
+        otypes.VmStatus.UP,
+        otypes.VmStatus.RESTORING_STATE,
+    ))
 except ImportError:
     pass
 
+# Every VM carries exactly one CDROM device under this fixed id:
+_CDROM_ID = '00000000-0000-0000-0000-000000000000'
+
+_UNCOMPUTED = object()
+
+# cloud_init carries NIC keys alongside plain Initialization kwargs; the
+# NIC ones must not reach otypes.Initialization(**...):
+_CLOUD_INIT_NIC_KEYS = frozenset((
+    'nic_boot_protocol',
+    'nic_name',
+    'nic_on_boot',
+    'nic_ip_address',
+    'nic_netmask',
+    'nic_gateway',
+))
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_FUTURES = True
+except ImportError:
+    HAS_FUTURES = False
+
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.ovirt import (
     BaseModule,
@@ -840,7 +897,6 @@ from ansible.module_utils.ovirt import (
     create_connection,
     equal,
     get_dict_of_struct,
-    get_entity,
     get_link_name,
     get_id_by_name,
     ovirt_full_argument_spec,
@@ -849,11 +905,126 @@ from ansible.module_utils.ovirt import (
 )
 
 
+# process-wide name -> id memo for engine objects that are looked up
+# repeatedly (cluster, storage domain, instance type, ...)
+_NAME_ID_CACHE = {}
+
+_LOOKUP_CACHE_DIR = os.path.expanduser('~/.ansible/tmp/ovirt_vms_cache')
+
+
+@lru_cache(maxsize=256)
+def _custom_property(name, regexp, value):
+    # custom properties are immutable once built, and batched runs
+    # pass the same (name, regexp, value) set for many VMs
+    return otypes.CustomProperty(name=name, regexp=regexp, value=value)
+
+
 class VmsModule(BaseModule):
 
+    # keep per-instance storage small; wide-fanout strategies fork one
+    # module process per host and the batched path builds one instance
+    # per VM
+    __slots__ = ('_initialization', '_is_new', '_link_names', '_last_check', '_system', '_vnic_profile_index')
+
     def __init__(self, *args, **kwargs):
         super(VmsModule, self).__init__(*args, **kwargs)
-        self._initialization = None
+        self._system = self._connection.system_service()
+        self._initialization = _UNCOMPUTED
+        self._is_new = False
+        self._link_names = {}
+        self._last_check = None
+        self._vnic_profile_index = None
+
+    @staticmethod
+    def _followed_or_list(prefetched, service):
+        """
+        Use a collection prefetched with get(follow=...) only when it
+        actually carries elements. On SDKs where follow is unsupported the
+        attribute is an empty href-carrying link stub (a list subclass),
+        indistinguishable from 'no devices'; an empty result therefore
+        always re-checks with a real listing.
+        """
+        if isinstance(prefetched, list) and prefetched:
+            return prefetched
+        return service.list()
+
+    def _link_name(self, link):
+        """
+        Memoized get_link_name; resolving a link's name is an engine GET
+        and update_check may run repeatedly against the same links.
+        """
+        if link is None:
+            return None
+        key = getattr(link, 'href', None) or link.id
+        if key not in self._link_names:
+            self._link_names[key] = get_link_name(self._connection, link)
+        return self._link_names[key]
+
+    def __lookup_cache_file(self):
+        digest = hashlib.md5(self._connection.url.encode('utf-8')).hexdigest()
+        return os.path.join(_LOOKUP_CACHE_DIR, '%s.json' % digest)
+
+    def __read_lookup_cache(self, path, timeout):
+        try:
+            if time.time() - os.path.getmtime(path) < timeout:
+                with open(path) as f:
+                    return json.load(f)
+        except (IOError, OSError, ValueError):
+            pass
+        return {}
+
+    def __write_lookup_cache(self, path, entries):
+        tmp = '%s.%s.tmp' % (path, os.getpid())
+        try:
+            if not os.path.isdir(_LOOKUP_CACHE_DIR):
+                os.makedirs(_LOOKUP_CACHE_DIR)
+            with open(tmp, 'w') as f:
+                json.dump(entries, f)
+            os.rename(tmp, path)
+        except (IOError, OSError):
+            pass
+
+    def _resolve_id(self, kind, service, name):
+        """
+        Resolve an engine object name to its ID, memoized per process
+        and backed by a per-engine json file so serial batches across
+        a large inventory don't repeat identical search requests.
+
+        Disk entries can be up to lookup_cache_timeout old and may point
+        at an object that was deleted or recreated under the same name,
+        so they are verified with a GET by id before being trusted; a
+        404 drops the entry and the name is searched again.
+        """
+        if name is None:
+            return None
+
+        key = (self._connection.url, kind, name)
+        hit = _NAME_ID_CACHE.get(key)
+        if hit is not None:
+            return hit
+
+        timeout = self.param('lookup_cache_timeout')
+        cache_file = None
+        file_key = '%s:%s' % (kind, name)
+        entries = {}
+        if timeout:
+            cache_file = self.__lookup_cache_file()
+            entries = self.__read_lookup_cache(cache_file, timeout)
+            hit = entries.get(file_key)
+            if hit is not None:
+                try:
+                    service.service(hit).get()
+                    _NAME_ID_CACHE[key] = hit
+                    return hit
+                except sdk.NotFoundError:
+                    entries.pop(file_key, None)
+
+        hit = get_id_by_name(service, name)
+        _NAME_ID_CACHE[key] = hit
+        if cache_file is not None:
+            entries[file_key] = hit
+            self.__write_lookup_cache(cache_file, entries)
+        return hit
 
     def __get_template_with_version(self):
         """
@@ -863,7 +1034,7 @@ class VmsModule(BaseModule):
         """
         template = None
         if self.param('template'):
-            templates_service = self._connection.system_service().templates_service()
+            templates_service = self._system.templates_service()
             templates = templates_service.list(search='name=%s' % self.param('template'))
             if self.param('template_version'):
                 templates = [
@@ -877,7 +1048,10 @@ class VmsModule(BaseModule):
                         self.param('template_version')
                     )
                 )
-            template = sorted(templates, key=lambda t: t.version.version_number, reverse=True)[0]
+            if len(templates) == 1:
+                template = templates[0]
+            else:
+                template = max(templates, key=lambda t: t.version.version_number)
 
         return template
 
@@ -889,198 +1063,276 @@ class VmsModule(BaseModule):
         if self.param('storage_domain') is None:
             return None
 
-        disks = list()
+        # one lookup and one struct for all attachments; resolving the
+        # storage domain inside the loop would cost a search per disk
+        storage_domain = otypes.StorageDomain(
+            id=self._resolve_id(
+                'storage_domain',
+                self._system.storage_domains_service(),
+                self.param('storage_domain')
+            )
+        )
+        disk_format = otypes.DiskFormat(self.param('disk_format'))
+
+        return [
+            otypes.DiskAttachment(
+                disk=otypes.Disk(
+                    id=att.disk.id,
+                    format=disk_format,
+                    storage_domains=[storage_domain]
+                )
+            )
+            for att in self._connection.follow_link(template.disk_attachments)
+        ]
 
-        for att in self._connection.follow_link(template.disk_attachments):
+    def __get_requested_disk_attachments(self):
+        """
+        Resolve the `disks` parameter into DiskAttachment structs so they
+        ride along on the create payload instead of costing one attach
+        call per disk afterwards.
+        """
+        disks = list()
+        disks_service = self._system.disks_service()
+        for disk in self.param('disks') or []:
+            disk_id = disk.get('id')
+            if disk_id is None:
+                disk_id = getattr(
+                    search_by_name(disks_service, disk.get('name')), 'id', None
+                )
+            if disk_id is None:
+                continue
             disks.append(
                 otypes.DiskAttachment(
                     disk=otypes.Disk(
-                        id=att.disk.id,
-                        format=otypes.DiskFormat(self.param('disk_format')),
-                        storage_domains=[
-                            otypes.StorageDomain(
-                                id=get_id_by_name(
-                                    self._connection.system_service().storage_domains_service(),
-                                    self.param('storage_domain')
-                                )
-                            )
-                        ]
-                    )
+                        id=disk_id,
+                    ),
+                    active=disk.get('activate', True),
+                    interface=otypes.DiskInterface(
+                        disk.get('interface', 'virtio')
+                    ),
+                    bootable=disk.get('bootable', False),
                 )
             )
-
         return disks
 
     def build_entity(self):
         template = self.__get_template_with_version()
 
         disk_attachments = self.__get_storage_domain_and_all_template_disks(template)
+        p = self._module.params
+        sys_svc = self._system
+        if self._is_new and p.get('disks'):
+            disk_attachments = (disk_attachments or []) + self.__get_requested_disk_attachments()
+
+        # bind repeatedly-read parameters once; the expression tree below
+        # reads several of them two or three times
+        cpu_cores = p.get('cpu_cores')
+        cpu_sockets = p.get('cpu_sockets')
+        cpu_threads = p.get('cpu_threads')
+        cpu_mode = p.get('cpu_mode')
+        cpu_pinning = p.get('cpu_pinning')
+        memory_guaranteed = p.get('memory_guaranteed')
+        memory_max = p.get('memory_max')
+        ballooning_enabled = p.get('ballooning_enabled')
+        boot_devices = p.get('boot_devices')
+        operating_system = p.get('operating_system')
+        serial_policy = p.get('serial_policy')
+        serial_policy_value = p.get('serial_policy_value')
+        custom_properties = p.get('custom_properties')
+        host = p.get('host')
 
         return otypes.Vm(
-            id=self.param('id'),
-            name=self.param('name'),
+            id=p.get('id'),
+            name=p.get('name'),
             cluster=otypes.Cluster(
-                name=self.param('cluster')
-            ) if self.param('cluster') else None,
+                name=p.get('cluster')
+            ) if p.get('cluster') else None,
             disk_attachments=disk_attachments,
             template=otypes.Template(
                 id=template.id,
             ) if template else None,
-            use_latest_template_version=self.param('use_latest_template_version'),
-            stateless=self.param('stateless') or self.param('use_latest_template_version'),
-            delete_protected=self.param('delete_protected'),
+            use_latest_template_version=p.get('use_latest_template_version'),
+            stateless=p.get('stateless') or p.get('use_latest_template_version'),
+            delete_protected=p.get('delete_protected'),
             bios=(
-                otypes.Bios(boot_menu=otypes.BootMenu(enabled=self.param('boot_menu')))
-            ) if self.param('boot_menu') is not None else None,
+                otypes.Bios(boot_menu=otypes.BootMenu(enabled=p.get('boot_menu')))
+            ) if p.get('boot_menu') is not None else None,
             console=(
-                otypes.Console(enabled=self.param('serial_console'))
-            ) if self.param('serial_console') is not None else None,
+                otypes.Console(enabled=p.get('serial_console'))
+            ) if p.get('serial_console') is not None else None,
             usb=(
-                otypes.Usb(enabled=self.param('usb_support'))
-            ) if self.param('usb_support') is not None else None,
+                otypes.Usb(enabled=p.get('usb_support'))
+            ) if p.get('usb_support') is not None else None,
             sso=(
                 otypes.Sso(
-                    methods=[otypes.Method(id=otypes.SsoMethod.GUEST_AGENT)] if self.param('sso') else []
+                    methods=[otypes.Method(id=otypes.SsoMethod.GUEST_AGENT)] if p.get('sso') else []
                 )
             ),
-            quota=otypes.Quota(id=self._module.params.get('quota_id')) if self.param('quota_id') is not None else None,
+            quota=otypes.Quota(id=p.get('quota_id')) if p.get('quota_id') is not None else None,
             high_availability=otypes.HighAvailability(
-                enabled=self.param('high_availability'),
-                priority=self.param('high_availability_priority'),
-            ) if self.param('high_availability') is not None or self.param('high_availability_priority') else None,
+                enabled=p.get('high_availability'),
+                priority=p.get('high_availability_priority'),
+            ) if p.get('high_availability') is not None or p.get('high_availability_priority') else None,
             lease=otypes.StorageDomainLease(
                 storage_domain=otypes.StorageDomain(
-                    id=get_id_by_name(
-                        service=self._connection.system_service().storage_domains_service(),
-                        name=self.param('lease')
+                    id=self._resolve_id(
+                        'storage_domain',
+                        sys_svc.storage_domains_service(),
+                        p.get('lease')
                     )
                 )
-            ) if self.param('lease') is not None else None,
+            ) if p.get('lease') is not None else None,
             cpu=otypes.Cpu(
                 topology=otypes.CpuTopology(
-                    cores=self.param('cpu_cores'),
-                    sockets=self.param('cpu_sockets'),
-                    threads=self.param('cpu_threads'),
+                    cores=cpu_cores,
+                    sockets=cpu_sockets,
+                    threads=cpu_threads,
                 ) if any((
-                    self.param('cpu_cores'),
-                    self.param('cpu_sockets'),
-                    self.param('cpu_threads')
+                    cpu_cores,
+                    cpu_sockets,
+                    cpu_threads
                 )) else None,
                 cpu_tune=otypes.CpuTune(
                     vcpu_pins=[
-                        otypes.VcpuPin(vcpu=int(pin['vcpu']), cpu_set=str(pin['cpu'])) for pin in self.param('cpu_pinning')
+                        otypes.VcpuPin(vcpu=int(pin['vcpu']), cpu_set=str(pin['cpu'])) for pin in cpu_pinning
                     ],
-                ) if self.param('cpu_pinning') else None,
-                mode=otypes.CpuMode(self.param('cpu_mode')) if self.param('cpu_mode') else None,
+                ) if cpu_pinning else None,
+                mode=otypes.CpuMode(cpu_mode) if cpu_mode else None,
             ) if any((
-                self.param('cpu_cores'),
-                self.param('cpu_sockets'),
-                self.param('cpu_threads'),
-                self.param('cpu_mode'),
-                self.param('cpu_pinning')
+                cpu_cores,
+                cpu_sockets,
+                cpu_threads,
+                cpu_mode,
+                cpu_pinning
             )) else None,
-            cpu_shares=self.param('cpu_shares'),
+            cpu_shares=p.get('cpu_shares'),
             os=otypes.OperatingSystem(
-                type=self.param('operating_system'),
+                type=operating_system,
                 boot=otypes.Boot(
                     devices=[
-                        otypes.BootDevice(dev) for dev in self.param('boot_devices')
+                        otypes.BootDevice(dev) for dev in boot_devices
                     ],
-                ) if self.param('boot_devices') else None,
+                ) if boot_devices else None,
             ) if (
-                self.param('operating_system') or self.param('boot_devices')
+                operating_system or boot_devices
             ) else None,
             type=otypes.VmType(
-                self.param('type')
-            ) if self.param('type') else None,
+                p.get('type')
+            ) if p.get('type') else None,
             memory=convert_to_bytes(
-                self.param('memory')
-            ) if self.param('memory') else None,
+                p.get('memory')
+            ) if p.get('memory') else None,
             memory_policy=otypes.MemoryPolicy(
-                guaranteed=convert_to_bytes(self.param('memory_guaranteed')),
-                ballooning=self.param('ballooning_enabled'),
-                max=convert_to_bytes(self.param('memory_max')),
+                guaranteed=convert_to_bytes(memory_guaranteed),
+                ballooning=ballooning_enabled,
+                max=convert_to_bytes(memory_max),
             ) if any((
-                self.param('memory_guaranteed'),
-                self.param('ballooning_enabled') is not None,
-                self.param('memory_max')
+                memory_guaranteed,
+                ballooning_enabled is not None,
+                memory_max
             )) else None,
             instance_type=otypes.InstanceType(
-                id=get_id_by_name(
-                    self._connection.system_service().instance_types_service(),
-                    self.param('instance_type'),
+                id=self._resolve_id(
+                    'instance_type',
+                    sys_svc.instance_types_service(),
+                    p.get('instance_type'),
                 ),
-            ) if self.param('instance_type') else None,
-            description=self.param('description'),
-            comment=self.param('comment'),
+            ) if p.get('instance_type') else None,
+            description=p.get('description'),
+            comment=p.get('comment'),
             time_zone=otypes.TimeZone(
-                name=self.param('timezone'),
-            ) if self.param('timezone') else None,
+                name=p.get('timezone'),
+            ) if p.get('timezone') else None,
             serial_number=otypes.SerialNumber(
-                policy=otypes.SerialNumberPolicy(self.param('serial_policy')),
-                value=self.param('serial_policy_value'),
+                policy=otypes.SerialNumberPolicy(serial_policy),
+                value=serial_policy_value,
             ) if (
-                self.param('serial_policy') is not None or
-                self.param('serial_policy_value') is not None
+                serial_policy is not None or
+                serial_policy_value is not None
             ) else None,
             placement_policy=otypes.VmPlacementPolicy(
-                affinity=otypes.VmAffinity(self.param('placement_policy')),
+                affinity=otypes.VmAffinity(p.get('placement_policy')),
                 hosts=[
-                    otypes.Host(name=self.param('host')),
-                ] if self.param('host') else None,
-            ) if self.param('placement_policy') else None,
-            soundcard_enabled=self.param('soundcard_enabled'),
+                    otypes.Host(name=host),
+                ] if host else None,
+            ) if p.get('placement_policy') else None,
+            soundcard_enabled=p.get('soundcard_enabled'),
             display=otypes.Display(
-                smartcard_enabled=self.param('smartcard_enabled')
-            ) if self.param('smartcard_enabled') is not None else None,
+                smartcard_enabled=p.get('smartcard_enabled')
+            ) if p.get('smartcard_enabled') is not None else None,
             io=otypes.Io(
-                threads=self.param('io_threads'),
-            ) if self.param('io_threads') is not None else None,
+                threads=p.get('io_threads'),
+            ) if p.get('io_threads') is not None else None,
             rng_device=otypes.RngDevice(
-                source=otypes.RngSource(self.param('rng_device')),
-            ) if self.param('rng_device') else None,
+                source=otypes.RngSource(p.get('rng_device')),
+            ) if p.get('rng_device') else None,
             custom_properties=[
-                otypes.CustomProperty(
-                    name=cp.get('name'),
-                    regexp=cp.get('regexp'),
-                    value=str(cp.get('value')),
-                ) for cp in self.param('custom_properties') if cp
-            ] if self.param('custom_properties') is not None else None,
-            initialization=self.get_initialization() if self.param('cloud_init_persist') else None,
+                _custom_property(
+                    cp.get('name'),
+                    cp.get('regexp'),
+                    str(cp.get('value')),
+                ) for cp in custom_properties if cp
+            ] if custom_properties is not None else None,
+            initialization=self.get_initialization() if p.get('cloud_init_persist') else None,
         )
 
-    def update_check(self, entity):
-        def check_cpu_pinning():
-            if self.param('cpu_pinning'):
-                current = []
-                if entity.cpu.cpu_tune:
-                    current = [(str(pin.cpu_set), int(pin.vcpu)) for pin in entity.cpu.cpu_tune.vcpu_pins]
-                passed = [(str(pin['cpu']), int(pin['vcpu'])) for pin in self.param('cpu_pinning')]
-                return sorted(current) == sorted(passed)
+    def _check_cpu_pinning(self, entity):
+        if not self.param('cpu_pinning'):
             return True
-
-        def check_custom_properties():
-            if self.param('custom_properties'):
-                current = []
-                if entity.custom_properties:
-                    current = [(cp.name, cp.regexp, str(cp.value)) for cp in entity.custom_properties]
-                passed = [(cp.get('name'), cp.get('regexp'), str(cp.get('value'))) for cp in self.param('custom_properties') if cp]
-                return sorted(current) == sorted(passed)
+        current = []
+        if entity.cpu.cpu_tune:
+            current = [(str(pin.cpu_set), int(pin.vcpu)) for pin in entity.cpu.cpu_tune.vcpu_pins]
+        passed = [(str(pin['cpu']), int(pin['vcpu'])) for pin in self.param('cpu_pinning')]
+        # Multiset compare; cheaper than sorting both sides:
+        return len(current) == len(passed) and Counter(current) == Counter(passed)
+
+    def _check_custom_properties(self, entity):
+        if not self.param('custom_properties'):
+            return True
+        current = []
+        if entity.custom_properties:
+            current = [(cp.name, cp.regexp, str(cp.value)) for cp in entity.custom_properties]
+        passed = [(cp.get('name'), cp.get('regexp'), str(cp.get('value'))) for cp in self.param('custom_properties') if cp]
+        return len(current) == len(passed) and Counter(current) == Counter(passed)
+
+    def _check_boot_devices(self, entity):
+        desired = self.param('boot_devices')
+        if desired is None:
+            return True
+        current = getattr(entity.os.boot, 'devices', None) or []
+        # Boot order matters, so compare positionally; the length check
+        # means mismatched sets never pay the per-device stringify:
+        if len(desired) != len(current):
+            return False
+        return all(d == str(c) for d, c in zip(desired, current))
+
+    def _check_host(self, entity):
+        if self.param('host') is None:
             return True
+        hosts = getattr(entity.placement_policy, 'hosts', None) or []
+        if len(hosts) <= 1:
+            return self.param('host') in [self._connection.follow_link(host).name for host in hosts]
+        # One hosts listing instead of a follow_link GET per pinned host:
+        hosts_service = self._system.hosts_service()
+        names_by_id = dict((h.id, h.name) for h in hosts_service.list())
+        return self.param('host') in [names_by_id.get(host.id) for host in hosts]
 
-        def check_host():
-            if self.param('host') is not None:
-                return self.param('host') in [self._connection.follow_link(host).name for host in getattr(entity.placement_policy, 'hosts', None) or []]
+    def update_check(self, entity):
+        # A VM that already matched is not re-diffed within the same
+        # invocation; module parameters cannot change under us, so only
+        # an entity status change can invalidate the verdict:
+        check_key = (entity.id, str(entity.status))
+        if self._last_check == check_key:
             return True
 
         cpu_mode = getattr(entity.cpu, 'mode')
         vm_display = entity.display
-        return (
-            check_cpu_pinning() and
-            check_custom_properties() and
-            check_host() and
+        # Cheap in-memory comparisons first; `and` short-circuits, so the
+        # comparisons that need extra engine round trips (get_link_name,
+        # check_host) only run when everything local already matches:
+        matched = (
             not self.param('cloud_init_persist') and
-            equal(self.param('cluster'), get_link_name(self._connection, entity.cluster)) and equal(convert_to_bytes(self.param('memory')), entity.memory) and
+            equal(convert_to_bytes(self.param('memory')), entity.memory) and
             equal(convert_to_bytes(self.param('memory_guaranteed')), entity.memory_policy.guaranteed) and
             equal(convert_to_bytes(self.param('memory_max')), entity.memory_policy.max) and
             equal(self.param('cpu_cores'), entity.cpu.topology.cores) and
@@ -1100,23 +1352,31 @@ class VmsModule(BaseModule):
             equal(self.param('quota_id'), getattr(entity.quota, 'id')) and
             equal(self.param('high_availability'), entity.high_availability.enabled) and
             equal(self.param('high_availability_priority'), entity.high_availability.priority) and
-            equal(self.param('lease'), get_link_name(self._connection, getattr(entity.lease, 'storage_domain', None))) and
             equal(self.param('stateless'), entity.stateless) and
             equal(self.param('cpu_shares'), entity.cpu_shares) and
             equal(self.param('delete_protected'), entity.delete_protected) and
             equal(self.param('use_latest_template_version'), entity.use_latest_template_version) and
-            equal(self.param('boot_devices'), [str(dev) for dev in getattr(entity.os.boot, 'devices', [])]) and
-            equal(self.param('instance_type'), get_link_name(self._connection, entity.instance_type), ignore_case=True) and
+            self._check_boot_devices(entity) and
             equal(self.param('description'), entity.description) and
             equal(self.param('comment'), entity.comment) and
             equal(self.param('timezone'), getattr(entity.time_zone, 'name', None)) and
             equal(self.param('serial_policy'), str(getattr(entity.serial_number, 'policy', None))) and
             equal(self.param('serial_policy_value'), getattr(entity.serial_number, 'value', None)) and
             equal(self.param('placement_policy'), str(entity.placement_policy.affinity) if entity.placement_policy else None) and
-            equal(self.param('rng_device'), str(entity.rng_device.source) if entity.rng_device else None)
+            equal(self.param('rng_device'), str(entity.rng_device.source) if entity.rng_device else None) and
+            self._check_cpu_pinning(entity) and
+            self._check_custom_properties(entity) and
+            equal(self.param('cluster'), self._link_name(entity.cluster)) and
+            equal(self.param('lease'), self._link_name(getattr(entity.lease, 'storage_domain', None))) and
+            equal(self.param('instance_type'), self._link_name(entity.instance_type), ignore_case=True) and
+            self._check_host(entity)
         )
+        if matched:
+            self._last_check = check_key
+        return matched
 
     def pre_create(self, entity):
+        self._is_new = entity is None
         # If VM don't exists, and template is not specified, set it to Blank:
         if entity is None:
             if self.param('template') is None:
@@ -1127,11 +1387,67 @@ class VmsModule(BaseModule):
 
     def post_present(self, entity_id):
         # After creation of the VM, attach disks and NICs:
-        entity = self._service.service(entity_id).get()
-        self.changed = self.__attach_disks(entity)
-        self.changed = self.__attach_nics(entity)
-        self.changed = self.__attach_watchdog(entity)
-        self.changed = self.__attach_graphical_console(entity)
+        self._link_names.clear()
+        self._last_check = None
+        # Embed the collections the attach steps diff against in the one
+        # refresh; an engine that ignores `follow` returns a plain VM and
+        # the steps fall back to their own listings:
+        try:
+            entity = self._service.service(entity_id).get(
+                follow='disk_attachments,nics,watchdogs,graphics_consoles'
+            )
+        except TypeError:
+            # The installed SDK predates the follow parameter:
+            entity = self._service.service(entity_id).get()
+
+        auth = getattr(self._module, '_ovirt_auth', None)
+        if HAS_FUTURES and auth is not None:
+            self.__parallel_post_present(entity, auth)
+        else:
+            self.changed = self.__attach_disks(entity)
+            self.changed = self.__attach_nics(entity)
+            self.changed = self.__attach_watchdog(entity)
+            self.changed = self.__attach_graphical_console(entity)
+
+    def __run_attach_step(self, step, auth, entity):
+        # the SDK connection is not safe for concurrent use, so every
+        # worker talks to the engine over its own connection
+        connection = create_connection(auth)
+        try:
+            worker = VmsModule(
+                connection=connection,
+                module=self._module,
+                service=connection.system_service().vms_service(),
+            )
+            changed = getattr(worker, step)(entity)
+            return bool(changed) or worker.changed
+        finally:
+            connection.close(logout=auth.get('token') is None)
+
+    def __parallel_post_present(self, entity, auth):
+        steps = []
+        if self.param('disks'):
+            steps.append('_VmsModule__attach_disks')
+        if self.param('nics'):
+            steps.append('_VmsModule__attach_nics')
+        if self.param('watchdog') is not None:
+            steps.append('_VmsModule__attach_watchdog')
+        if self.param('graphical_console'):
+            steps.append('_VmsModule__attach_graphical_console')
+
+        # not worth extra connections for a single pending step:
+        if len(steps) < 2:
+            for step in steps:
+                self.changed = getattr(self, step)(entity)
+            return
+
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [
+                executor.submit(self.__run_attach_step, step, auth, entity)
+                for step in steps
+            ]
+            for future in futures:
+                self.changed = future.result()
 
     def pre_remove(self, entity):
         # Forcibly stop the VM, if it's not in DOWN state:
@@ -1143,48 +1459,51 @@ class VmsModule(BaseModule):
                     wait_condition=lambda vm: vm.status == otypes.VmStatus.DOWN,
                 )['changed']
 
-    def __suspend_shutdown_common(self, vm_service):
-        if vm_service.get().status in [
-            otypes.VmStatus.MIGRATING,
-            otypes.VmStatus.POWERING_UP,
-            otypes.VmStatus.REBOOT_IN_PROGRESS,
-            otypes.VmStatus.WAIT_FOR_LAUNCH,
-            otypes.VmStatus.UP,
-            otypes.VmStatus.RESTORING_STATE,
-        ]:
+    def __suspend_shutdown_common(self, vm_service, status):
+        if status in _TRANSITIONAL_STATES:
             self._wait_for_UP(vm_service)
 
     def _pre_shutdown_action(self, entity):
         vm_service = self._service.vm_service(entity.id)
-        self.__suspend_shutdown_common(vm_service)
+        self.__suspend_shutdown_common(vm_service, entity.status)
         if entity.status in [otypes.VmStatus.SUSPENDED, otypes.VmStatus.PAUSED]:
             vm_service.start()
             self._wait_for_UP(vm_service)
-        return vm_service.get()
+            return vm_service.get()
+        return entity
 
     def _pre_suspend_action(self, entity):
         vm_service = self._service.vm_service(entity.id)
-        self.__suspend_shutdown_common(vm_service)
+        self.__suspend_shutdown_common(vm_service, entity.status)
         if entity.status in [otypes.VmStatus.PAUSED, otypes.VmStatus.DOWN]:
             vm_service.start()
             self._wait_for_UP(vm_service)
-        return vm_service.get()
+            return vm_service.get()
+        return entity
 
     def _post_start_action(self, entity):
         vm_service = self._service.service(entity.id)
         self._wait_for_UP(vm_service)
-        self._attach_cd(vm_service.get())
-        self._migrate_vm(vm_service.get())
+        # One fetch of the started VM serves both follow-up steps:
+        vm = vm_service.get()
+        self._attach_cd(vm)
+        self._migrate_vm(vm)
 
     def _attach_cd(self, entity):
         cd_iso = self.param('cd_iso')
         if cd_iso is not None:
             vm_service = self._service.service(entity.id)
-            current = vm_service.get().status == otypes.VmStatus.UP
+            current = entity.status == otypes.VmStatus.UP
             cdroms_service = vm_service.cdroms_service()
-            cdrom_device = cdroms_service.list()[0]
-            cdrom_service = cdroms_service.cdrom_service(cdrom_device.id)
-            cdrom = cdrom_service.get(current=current)
+            try:
+                # Address the device directly instead of listing just to
+                # read the first element:
+                cdrom_service = cdroms_service.cdrom_service(_CDROM_ID)
+                cdrom = cdrom_service.get(current=current)
+            except sdk.NotFoundError:
+                cdrom_device = cdroms_service.list()[0]
+                cdrom_service = cdroms_service.cdrom_service(cdrom_device.id)
+                cdrom = cdrom_service.get(current=current)
             if getattr(cdrom.file, 'id', '') != cd_iso:
                 if not self._module.check_mode:
                     cdrom_service.update(
@@ -1203,7 +1522,7 @@ class VmsModule(BaseModule):
         if vm_host is not None:
             # In case VM is preparing to be UP, wait to be up, to migrate it:
             if entity.status == otypes.VmStatus.UP:
-                hosts_service = self._connection.system_service().hosts_service()
+                hosts_service = self._system.hosts_service()
                 current_vm_host = hosts_service.host_service(entity.host.id).get().name
                 if vm_host != current_vm_host:
                     if not self._module.check_mode:
@@ -1219,18 +1538,34 @@ class VmsModule(BaseModule):
             condition=lambda vm: vm.status == otypes.VmStatus.UP,
             wait=self.param('wait'),
             timeout=self.param('timeout'),
+            poll_interval=self.param('poll_interval'),
         )
 
     def _wait_for_vm_disks(self, vm_service):
-        disks_service = self._connection.system_service().disks_service()
-        for da in vm_service.disk_attachments_service().list():
-            disk_service = disks_service.disk_service(da.disk.id)
-            wait(
-                service=disk_service,
-                condition=lambda disk: disk.status == otypes.DiskStatus.OK,
-                wait=self.param('wait'),
-                timeout=self.param('timeout'),
+        if not self.param('wait'):
+            return
+        disks_service = self._system.disks_service()
+        pending = set(
+            da.disk.id for da in vm_service.disk_attachments_service().list()
+        )
+        # Check all disks in each pass instead of waiting them out one by
+        # one; the disks become ready concurrently on the storage side:
+        start = time.time()
+        timeout = self.param('timeout')
+        delay = 0.25
+        while pending:
+            pending = set(
+                disk_id for disk_id in pending
+                if disks_service.disk_service(disk_id).get().status != otypes.DiskStatus.OK
             )
+            if not pending:
+                return
+            if time.time() > start + timeout:
+                self._module.fail_json(
+                    msg="Timeout exceed while waiting on result state of the entity."
+                )
+            time.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(float(self.param('poll_interval')), delay * 2)
 
     def wait_for_down(self, vm):
         """
@@ -1244,20 +1579,21 @@ class VmsModule(BaseModule):
             condition=lambda vm: vm.status == otypes.VmStatus.DOWN,
             wait=self.param('wait'),
             timeout=self.param('timeout'),
+            poll_interval=self.param('poll_interval'),
         )
         if vm.stateless:
             snapshots_service = vm_service.snapshots_service()
-            snapshots = snapshots_service.list()
-            snap_active = [
-                snap for snap in snapshots
-                if snap.snapshot_type == otypes.SnapshotType.ACTIVE
-            ][0]
-            snap_stateless = [
-                snap for snap in snapshots
-                if snap.snapshot_type == otypes.SnapshotType.STATELESS
-            ]
+            # The snapshots collection has no server-side type filter, so
+            # pick both snapshots out of one listing in a single pass:
+            snap_active = None
+            snap_stateless = None
+            for snap in snapshots_service.list():
+                if snap.snapshot_type == otypes.SnapshotType.ACTIVE:
+                    snap_active = snap
+                elif snap_stateless is None and snap.snapshot_type == otypes.SnapshotType.STATELESS:
+                    snap_stateless = snap
             # Stateless snapshot may be already removed:
-            if snap_stateless:
+            if snap_stateless is not None:
                 """
                 We need to wait for Active snapshot ID, to be removed as it's current
                 stateless snapshot. Then we need to wait for staless snapshot ID to
@@ -1268,23 +1604,29 @@ class VmsModule(BaseModule):
                     condition=lambda snap: snap is None,
                     wait=self.param('wait'),
                     timeout=self.param('timeout'),
+                    poll_interval=self.param('poll_interval'),
                 )
-                wait(
-                    service=snapshots_service.snapshot_service(snap_stateless[0].id),
-                    condition=lambda snap: snap.snapshot_status == otypes.SnapshotStatus.OK,
-                    wait=self.param('wait'),
-                    timeout=self.param('timeout'),
-                )
+                # The restore usually finishes with the active-snapshot
+                # removal; skip the second wait when it already has:
+                if snap_stateless.snapshot_status != otypes.SnapshotStatus.OK:
+                    wait(
+                        service=snapshots_service.snapshot_service(snap_stateless.id),
+                        condition=lambda snap: snap.snapshot_status == otypes.SnapshotStatus.OK,
+                        wait=self.param('wait'),
+                        timeout=self.param('timeout'),
+                        poll_interval=self.param('poll_interval'),
+                    )
         return True
 
     def __attach_graphical_console(self, entity):
         graphical_console = self.param('graphical_console')
         if not graphical_console:
-            return
+            return False
 
         vm_service = self._service.service(entity.id)
         gcs_service = vm_service.graphics_consoles_service()
-        graphical_consoles = gcs_service.list()
+        prefetched = getattr(entity, 'graphics_consoles', None)
+        graphical_consoles = self._followed_or_list(prefetched, gcs_service)
 
         # Remove all graphical consoles if there are any:
         if bool(graphical_console.get('headless_mode')):
@@ -1298,91 +1640,137 @@ class VmsModule(BaseModule):
         if isinstance(protocol, str):
             protocol = [protocol]
 
-        current_protocols = [str(gc.protocol) for gc in graphical_consoles]
-        if not current_protocols:
-            if not self._module.check_mode:
-                for p in protocol:
-                    gcs_service.add(
-                        otypes.GraphicsConsole(
-                            protocol=otypes.GraphicsType(p),
-                        )
-                    )
-            return True
+        desired_protocols = set(protocol)
+        current_protocols = set(str(gc.protocol) for gc in graphical_consoles)
+        if desired_protocols == current_protocols:
+            return False
 
-        # Update consoles:
-        if sorted(protocol) != sorted(current_protocols):
-            if not self._module.check_mode:
-                for gc in graphical_consoles:
+        # Update consoles; only touch the ones that differ instead of
+        # removing and re-adding the whole set:
+        if not self._module.check_mode:
+            for gc in graphical_consoles:
+                if str(gc.protocol) not in desired_protocols:
                     gcs_service.console_service(gc.id).remove()
-                for p in protocol:
-                    gcs_service.add(
-                        otypes.GraphicsConsole(
-                            protocol=otypes.GraphicsType(p),
-                        )
+            for p in desired_protocols - current_protocols:
+                gcs_service.add(
+                    otypes.GraphicsConsole(
+                        protocol=otypes.GraphicsType(p),
                     )
-            return True
+                )
+        return True
 
     def __attach_disks(self, entity):
         if not self.param('disks'):
-            return
+            return False
 
+        changed = False
         vm_service = self._service.service(entity.id)
-        disks_service = self._connection.system_service().disks_service()
+        disks_service = self._system.disks_service()
         disk_attachments_service = vm_service.disk_attachments_service()
 
         self._wait_for_vm_disks(vm_service)
+        # Resolve every missing disk id with one search instead of one
+        # GET per disk:
+        names = [
+            disk.get('name') for disk in self.param('disks')
+            if disk.get('id') is None and disk.get('name')
+        ]
+        ids_by_name = {}
+        if names:
+            ids_by_name = dict(
+                (d.name, d.id)
+                for d in disks_service.list(
+                    search=' or '.join('name=%s' % name for name in names)
+                )
+            )
+        # Presence is decided against one attachment listing (or the
+        # followed fetch) instead of a per-disk existence GET:
+        prefetched = getattr(entity, 'disk_attachments', None)
+        existing_ids = frozenset(
+            da.disk.id
+            for da in self._followed_or_list(prefetched, disk_attachments_service)
+        )
+        to_add = []
         for disk in self.param('disks'):
             # If disk ID is not specified, find disk by name:
             disk_id = disk.get('id')
             if disk_id is None:
-                disk_id = getattr(
-                    search_by_name(
-                        service=disks_service,
-                        name=disk.get('name')
-                    ),
-                    'id',
-                    None
-                )
+                disk_id = ids_by_name.get(disk.get('name'))
 
             # Attach disk to VM:
-            disk_attachment = disk_attachments_service.attachment_service(disk_id)
-            if get_entity(disk_attachment) is None:
-                if not self._module.check_mode:
-                    disk_attachments_service.add(
-                        otypes.DiskAttachment(
-                            disk=otypes.Disk(
-                                id=disk_id,
-                            ),
-                            active=disk.get('activate', True),
-                            interface=otypes.DiskInterface(
-                                disk.get('interface', 'virtio')
-                            ),
-                            bootable=disk.get('bootable', False),
-                        )
+            if disk_id not in existing_ids:
+                to_add.append(
+                    otypes.DiskAttachment(
+                        disk=otypes.Disk(
+                            id=disk_id,
+                        ),
+                        active=disk.get('activate', True),
+                        interface=otypes.DiskInterface(
+                            disk.get('interface', 'virtio')
+                        ),
+                        bootable=disk.get('bootable', False),
                     )
-                self.changed = True
+                )
+        if not to_add:
+            return changed
+        if self._module.check_mode:
+            return True
+
+        auth = getattr(self._module, '_ovirt_auth', None)
+        if HAS_FUTURES and auth is not None and len(to_add) > 1:
+            # Fan the attach POSTs out over a few workers; each worker
+            # gets a slice and its own connection, since the shared SDK
+            # connection is not safe for concurrent use:
+            workers = min(len(to_add), 4)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        self.__add_disk_attachments, auth, entity.id, to_add[i::workers]
+                    )
+                    for i in range(workers)
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for attachment in to_add:
+                disk_attachments_service.add(attachment)
+        return True
+
+    @staticmethod
+    def __add_disk_attachments(auth, vm_id, attachments):
+        connection = create_connection(auth)
+        try:
+            disk_attachments_service = connection.system_service().vms_service().vm_service(
+                vm_id
+            ).disk_attachments_service()
+            for attachment in attachments:
+                disk_attachments_service.add(attachment)
+        finally:
+            connection.close(logout=auth.get('token') is None)
 
     def __get_vnic_profile_id(self, nic):
         """
         Return VNIC profile ID looked up by it's name, because there can be
         more VNIC profiles with same name, other criteria of filter is cluster.
         """
-        vnics_service = self._connection.system_service().vnic_profiles_service()
-        clusters_service = self._connection.system_service().clusters_service()
-        cluster = search_by_name(clusters_service, self.param('cluster'))
-        profiles = [
-            profile for profile in vnics_service.list()
-            if profile.name == nic.get('profile_name')
-        ]
-        cluster_networks = [
-            net.id for net in self._connection.follow_link(cluster.networks)
-        ]
-        try:
-            return next(
-                profile.id for profile in profiles
+        if self._vnic_profile_index is None:
+            # The profile listing and the cluster's networks are the same
+            # for every NIC of the VM; fetch them once and index by name:
+            sys_svc = self._system
+            vnics_service = sys_svc.vnic_profiles_service()
+            clusters_service = sys_svc.clusters_service()
+            cluster = search_by_name(clusters_service, self.param('cluster'))
+            cluster_networks = frozenset(
+                net.id for net in self._connection.follow_link(cluster.networks)
+            )
+            self._vnic_profile_index = dict(
+                (profile.name, profile.id)
+                for profile in vnics_service.list()
                 if profile.network.id in cluster_networks
             )
-        except StopIteration:
+        try:
+            return self._vnic_profile_index[nic.get('profile_name')]
+        except KeyError:
             raise Exception(
                 "Profile '%s' was not found in cluster '%s'" % (
                     nic.get('profile_name'),
@@ -1394,7 +1782,11 @@ class VmsModule(BaseModule):
         watchdogs_service = self._service.service(entity.id).watchdogs_service()
         watchdog = self.param('watchdog')
         if watchdog is not None:
-            current_watchdog = next(iter(watchdogs_service.list()), None)
+            prefetched = getattr(entity, 'watchdogs', None)
+            current_watchdog = next(
+                iter(self._followed_or_list(prefetched, watchdogs_service)),
+                None,
+            )
             if watchdog.get('model') is None and current_watchdog:
                 watchdogs_service.watchdog_service(current_watchdog.id).remove()
                 return True
@@ -1407,14 +1799,18 @@ class VmsModule(BaseModule):
                 )
                 return True
             elif current_watchdog is not None:
+                desired_model = watchdog.get('model').lower()
+                desired_action = watchdog.get('action').lower()
                 if (
-                    str(current_watchdog.model).lower() != watchdog.get('model').lower() or
-                    str(current_watchdog.action).lower() != watchdog.get('action').lower()
+                    str(current_watchdog.model).lower() != desired_model or
+                    str(current_watchdog.action).lower() != desired_action
                 ):
                     watchdogs_service.watchdog_service(current_watchdog.id).update(
                         otypes.Watchdog(
-                            model=otypes.WatchdogModel(watchdog.get('model')),
-                            action=otypes.WatchdogAction(watchdog.get('action')),
+                            # lowered like the create branch, so an update
+                            # converges instead of re-updating every run:
+                            model=otypes.WatchdogModel(desired_model),
+                            action=otypes.WatchdogAction(desired_action),
                         )
                     )
                     return True
@@ -1422,230 +1818,261 @@ class VmsModule(BaseModule):
 
     def __attach_nics(self, entity):
         # Attach NICs to VM, if specified:
+        changed = False
         nics_service = self._service.service(entity.id).nics_service()
-        for nic in self.param('nics'):
-            if search_by_name(nics_service, nic.get('name')) is None:
-                if not self._module.check_mode:
-                    nics_service.add(
-                        otypes.Nic(
-                            name=nic.get('name'),
-                            interface=otypes.NicInterface(
-                                nic.get('interface', 'virtio')
-                            ),
-                            vnic_profile=otypes.VnicProfile(
-                                id=self.__get_vnic_profile_id(nic),
-                            ) if nic.get('profile_name') else None,
-                            mac=otypes.Mac(
-                                address=nic.get('mac_address')
-                            ) if nic.get('mac_address') else None,
-                        )
+        # One listing covers the existence check for every NIC; profile
+        # ids resolve through the cached index before any fan-out, so
+        # workers share no lookups. A followed fetch already embeds the
+        # NICs and costs nothing extra:
+        prefetched = getattr(entity, 'nics', None)
+        existing_names = frozenset(
+            nic.name
+            for nic in self._followed_or_list(prefetched, nics_service)
+        )
+        to_add = [
+            otypes.Nic(
+                name=nic.get('name'),
+                interface=otypes.NicInterface(
+                    nic.get('interface', 'virtio')
+                ),
+                vnic_profile=otypes.VnicProfile(
+                    id=self.__get_vnic_profile_id(nic),
+                ) if nic.get('profile_name') else None,
+                mac=otypes.Mac(
+                    address=nic.get('mac_address')
+                ) if nic.get('mac_address') else None,
+            )
+            for nic in self.param('nics') or []
+            if nic.get('name') not in existing_names
+        ]
+        if not to_add:
+            return changed
+        if self._module.check_mode:
+            return True
+
+        auth = getattr(self._module, '_ovirt_auth', None)
+        if HAS_FUTURES and auth is not None and len(to_add) > 1:
+            workers = min(len(to_add), 4)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        self.__add_nics, auth, entity.id, to_add[i::workers]
                     )
-                self.changed = True
+                    for i in range(workers)
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for nic_struct in to_add:
+                nics_service.add(nic_struct)
+        return True
+
+    @staticmethod
+    def __add_nics(auth, vm_id, nics):
+        connection = create_connection(auth)
+        try:
+            nics_service = connection.system_service().vms_service().vm_service(
+                vm_id
+            ).nics_service()
+            for nic in nics:
+                nics_service.add(nic)
+        finally:
+            connection.close(logout=auth.get('token') is None)
 
     def get_initialization(self):
-        if self._initialization is not None:
+        # The unconfigured (None) outcome is memoized as well, so the
+        # parameter walk below runs at most once:
+        if self._initialization is not _UNCOMPUTED:
             return self._initialization
 
         sysprep = self.param('sysprep')
         cloud_init = self.param('cloud_init')
-        cloud_init_nics = self.param('cloud_init_nics') or []
+        cloud_init_nics = list(self.param('cloud_init_nics') or [])
         if cloud_init is not None:
             cloud_init_nics.append(cloud_init)
 
         if cloud_init or cloud_init_nics:
-            self._initialization = otypes.Initialization(
-                nic_configurations=[
+            nic_configurations = []
+            for nic in cloud_init_nics:
+                # One pass of reads per NIC; nothing is popped, so the
+                # caller's parameter dicts stay intact:
+                has_ip = (
+                    nic.get('nic_ip_address') is not None or
+                    nic.get('nic_netmask') is not None or
+                    nic.get('nic_gateway') is not None
+                )
+                if not (
+                    has_ip or
+                    nic.get('nic_boot_protocol') is not None or
+                    nic.get('nic_on_boot') is not None
+                ):
+                    continue
+                nic_configurations.append(
                     otypes.NicConfiguration(
                         boot_protocol=otypes.BootProtocol(
-                            nic.pop('nic_boot_protocol').lower()
+                            nic['nic_boot_protocol'].lower()
                         ) if nic.get('nic_boot_protocol') else None,
-                        name=nic.pop('nic_name', None),
-                        on_boot=nic.pop('nic_on_boot', None),
+                        name=nic.get('nic_name'),
+                        on_boot=nic.get('nic_on_boot'),
                         ip=otypes.Ip(
-                            address=nic.pop('nic_ip_address', None),
-                            netmask=nic.pop('nic_netmask', None),
-                            gateway=nic.pop('nic_gateway', None),
-                        ) if (
-                            nic.get('nic_gateway') is not None or
-                            nic.get('nic_netmask') is not None or
-                            nic.get('nic_ip_address') is not None
-                        ) else None,
+                            address=nic.get('nic_ip_address'),
+                            netmask=nic.get('nic_netmask'),
+                            gateway=nic.get('nic_gateway'),
+                        ) if has_ip else None,
                     )
-                    for nic in cloud_init_nics
-                    if (
-                        nic.get('nic_gateway') is not None or
-                        nic.get('nic_netmask') is not None or
-                        nic.get('nic_ip_address') is not None or
-                        nic.get('nic_boot_protocol') is not None or
-                        nic.get('nic_on_boot') is not None
-                    )
-                ] if cloud_init_nics else None,
-                **cloud_init
+                )
+            self._initialization = otypes.Initialization(
+                nic_configurations=nic_configurations if cloud_init_nics else None,
+                **dict(
+                    (key, value) for key, value in (cloud_init or {}).items()
+                    if key not in _CLOUD_INIT_NIC_KEYS
+                )
             )
         elif sysprep:
             self._initialization = otypes.Initialization(
                 **sysprep
             )
+        else:
+            self._initialization = None
         return self._initialization
 
 
+def _name_pair_mapping(mapping, wrapper_cls, entity_cls):
+    """
+    Build a registration mapping wrapper from a source/dest name pair;
+    all of the name-based _get_*_mappings builders share this shape.
+    """
+    return wrapper_cls(
+        from_=entity_cls(
+            name=mapping['source_name'],
+        ) if mapping['source_name'] else None,
+        to=entity_cls(
+            name=mapping['dest_name'],
+        ) if mapping['dest_name'] else None,
+    )
+
+
 def _get_role_mappings(module):
-    roleMappings = list()
-
-    for roleMapping in module.params['role_mappings']:
-        roleMappings.append(
-            otypes.RegistrationRoleMapping(
-                from_=otypes.Role(
-                    name=roleMapping['source_name'],
-                ) if roleMapping['source_name'] else None,
-                to=otypes.Role(
-                    name=roleMapping['dest_name'],
-                ) if roleMapping['dest_name'] else None,
-            )
-        )
-    return roleMappings
+    return [
+        _name_pair_mapping(mapping, otypes.RegistrationRoleMapping, otypes.Role)
+        for mapping in module.params['role_mappings']
+    ]
 
 
 def _get_affinity_group_mappings(module):
-    affinityGroupMappings = list()
-
-    for affinityGroupMapping in module.params['affinity_group_mappings']:
-        affinityGroupMappings.append(
-            otypes.RegistrationAffinityGroupMapping(
-                from_=otypes.AffinityGroup(
-                    name=affinityGroupMapping['source_name'],
-                ) if affinityGroupMapping['source_name'] else None,
-                to=otypes.AffinityGroup(
-                    name=affinityGroupMapping['dest_name'],
-                ) if affinityGroupMapping['dest_name'] else None,
-            )
-        )
-    return affinityGroupMappings
+    return [
+        _name_pair_mapping(mapping, otypes.RegistrationAffinityGroupMapping, otypes.AffinityGroup)
+        for mapping in module.params['affinity_group_mappings']
+    ]
 
 
 def _get_affinity_label_mappings(module):
-    affinityLabelMappings = list()
-
-    for affinityLabelMapping in module.params['affinity_label_mappings']:
-        affinityLabelMappings.append(
-            otypes.RegistrationAffinityLabelMapping(
-                from_=otypes.AffinityLabel(
-                    name=affinityLabelMapping['source_name'],
-                ) if affinityLabelMapping['source_name'] else None,
-                to=otypes.AffinityLabel(
-                    name=affinityLabelMapping['dest_name'],
-                ) if affinityLabelMapping['dest_name'] else None,
-            )
-        )
-    return affinityLabelMappings
+    return [
+        _name_pair_mapping(mapping, otypes.RegistrationAffinityLabelMapping, otypes.AffinityLabel)
+        for mapping in module.params['affinity_label_mappings']
+    ]
 
 
 def _get_domain_mappings(module):
-    domainMappings = list()
-
-    for domainMapping in module.params['domain_mappings']:
-        domainMappings.append(
-            otypes.RegistrationDomainMapping(
-                from_=otypes.Domain(
-                    name=domainMapping['source_name'],
-                ) if domainMapping['source_name'] else None,
-                to=otypes.Domain(
-                    name=domainMapping['dest_name'],
-                ) if domainMapping['dest_name'] else None,
-            )
-        )
-    return domainMappings
+    return [
+        _name_pair_mapping(mapping, otypes.RegistrationDomainMapping, otypes.Domain)
+        for mapping in module.params['domain_mappings']
+    ]
 
 
 def _get_lun_mappings(module):
-    lunMappings = list()
-    for lunMapping in module.params['lun_mappings']:
-        lunMappings.append(
-            otypes.RegistrationLunMapping(
-                from_=otypes.Disk(
-                    lun_storage=otypes.HostStorage(
-                        type=otypes.StorageType(lunMapping['source_storage_type'])
-                        if (lunMapping['source_storage_type'] in
-                            ['iscsi', 'fcp']) else None,
-                        logical_units=[
-                            otypes.LogicalUnit(
-                                id=lunMapping['source_logical_unit_id'],
-                            )
-                        ],
-                    ),
-                ) if lunMapping['source_logical_unit_id'] else None,
-                to=otypes.Disk(
-                    lun_storage=otypes.HostStorage(
-                        type=otypes.StorageType(lunMapping['dest_storage_type'])
-                        if (lunMapping['dest_storage_type'] in
-                            ['iscsi', 'fcp']) else None,
-                        logical_units=[
-                            otypes.LogicalUnit(
-                                id=lunMapping['dest_logical_unit_id'],
-                                port=lunMapping['dest_logical_unit_port'],
-                                portal=lunMapping['dest_logical_unit_portal'],
-                                address=lunMapping['dest_logical_unit_address'],
-                                target=lunMapping['dest_logical_unit_target'],
-                                password=lunMapping['dest_logical_unit_password'],
-                                username=lunMapping['dest_logical_unit_username'],
-                            )
-                        ],
-                    ),
-                ) if lunMapping['dest_logical_unit_id'] else None,
-            ),
-        ),
-    return lunMappings
+    return [
+        otypes.RegistrationLunMapping(
+            from_=otypes.Disk(
+                lun_storage=otypes.HostStorage(
+                    type=otypes.StorageType(lunMapping['source_storage_type'])
+                    if (lunMapping['source_storage_type'] in
+                        ['iscsi', 'fcp']) else None,
+                    logical_units=[
+                        otypes.LogicalUnit(
+                            id=lunMapping['source_logical_unit_id'],
+                        )
+                    ],
+                ),
+            ) if lunMapping['source_logical_unit_id'] else None,
+            to=otypes.Disk(
+                lun_storage=otypes.HostStorage(
+                    type=otypes.StorageType(lunMapping['dest_storage_type'])
+                    if (lunMapping['dest_storage_type'] in
+                        ['iscsi', 'fcp']) else None,
+                    logical_units=[
+                        otypes.LogicalUnit(
+                            id=lunMapping['dest_logical_unit_id'],
+                            port=lunMapping['dest_logical_unit_port'],
+                            portal=lunMapping['dest_logical_unit_portal'],
+                            address=lunMapping['dest_logical_unit_address'],
+                            target=lunMapping['dest_logical_unit_target'],
+                            password=lunMapping['dest_logical_unit_password'],
+                            username=lunMapping['dest_logical_unit_username'],
+                        )
+                    ],
+                ),
+            ) if lunMapping['dest_logical_unit_id'] else None,
+        )
+        for lunMapping in module.params['lun_mappings']
+    ]
 
 
 def _get_cluster_mappings(module):
-    clusterMappings = list()
-
-    for clusterMapping in module.params['cluster_mappings']:
-        clusterMappings.append(
-            otypes.RegistrationClusterMapping(
-                from_=otypes.Cluster(
-                    name=clusterMapping['source_name'],
-                ),
-                to=otypes.Cluster(
-                    name=clusterMapping['dest_name'],
-                ) if clusterMapping['dest_name'] else None,
-            )
+    # The source cluster is built unconditionally; registration always
+    # names where a cluster came from:
+    return [
+        otypes.RegistrationClusterMapping(
+            from_=otypes.Cluster(
+                name=mapping['source_name'],
+            ),
+            to=otypes.Cluster(
+                name=mapping['dest_name'],
+            ) if mapping['dest_name'] else None,
         )
-    return clusterMappings
+        for mapping in module.params['cluster_mappings']
+    ]
 
 
 def _get_vnic_profile_mappings(module):
-    vnicProfileMappings = list()
-
-    for vnicProfileMapping in module.params['vnic_profile_mappings']:
-        vnicProfileMappings.append(
-            otypes.VnicProfileMapping(
-                source_network_name=vnicProfileMapping['source_network_name'],
-                source_network_profile_name=vnicProfileMapping['source_profile_name'],
-                target_vnic_profile=otypes.VnicProfile(
-                    id=vnicProfileMapping['target_profile_id'],
-                ) if vnicProfileMapping['target_profile_id'] else None,
-            )
+    return [
+        otypes.VnicProfileMapping(
+            source_network_name=mapping['source_network_name'],
+            source_network_profile_name=mapping['source_profile_name'],
+            target_vnic_profile=otypes.VnicProfile(
+                id=mapping['target_profile_id'],
+            ) if mapping['target_profile_id'] else None,
         )
+        for mapping in module.params['vnic_profile_mappings']
+    ]
+
 
-    return vnicProfileMappings
+def _exists(service, name):
+    # Presence check only; max=1 keeps the response to a single row
+    # where search_by_name would transfer full representations:
+    return bool(service.list(search='name=%s' % name, max=1))
 
 
-def import_vm(module, connection):
-    vms_service = connection.system_service().vms_service()
-    if search_by_name(vms_service, module.params['name']) is not None:
+def import_vm(module, connection, existing_vm=None):
+    system_service = connection.system_service()
+    vms_service = system_service.vms_service()
+    # The caller usually holds the result of its own search already; only
+    # search again when it does not:
+    if existing_vm is not None:
+        return False
+    if _exists(vms_service, module.params['name']):
         return False
 
-    events_service = connection.system_service().events_service()
+    events_service = system_service.events_service()
     last_event = events_service.list(max=1)[0]
 
-    external_type = [
-        tmp for tmp in ['kvm', 'xen', 'vmware']
+    external_type = next(
+        tmp for tmp in ('kvm', 'xen', 'vmware')
         if module.params[tmp] is not None
-    ][0]
+    )
 
     external_vm = module.params[external_type]
-    imports_service = connection.system_service().external_vm_imports_service()
+    imports_service = system_service.external_vm_imports_service()
     imported_vm = imports_service.add(
         otypes.ExternalVmImport(
             vm=otypes.Vm(
@@ -1669,22 +2096,89 @@ def import_vm(module, connection):
         )
     )
 
-    # Wait until event with code 1152 for our VM don't appear:
-    vms_service = connection.system_service().vms_service()
-    wait(
-        service=vms_service.vm_service(imported_vm.vm.id),
-        condition=lambda vm: len([
-            event
-            for event in events_service.list(
-                from_=int(last_event.id),
-                search='type=1152 and vm.id=%s' % vm.id,
+    # Wait until event with code 1152 for our VM don't appear. The
+    # engine offers no event stream through this SDK, so the edge is
+    # still detected by polling, but each iteration costs one bounded
+    # events query instead of a VM GET plus an unbounded listing; the
+    # vanished-VM failure check runs only every few polls:
+    vm_service = vms_service.vm_service(imported_vm.vm.id)
+    search = 'type=1152 and vm.id=%s' % imported_vm.vm.id
+    start = time.time()
+    timeout = module.params['timeout']
+    delay = 0.25
+    attempt = 0
+    while time.time() < start + timeout:
+        if events_service.list(from_=int(last_event.id), search=search, max=1):
+            return True
+        if attempt % 4 == 3:
+            try:
+                vm_service.get()
+            except sdk.NotFoundError:
+                module.fail_json(msg="Error while waiting on result state of the entity.")
+        attempt += 1
+        time.sleep(delay * random.uniform(0.8, 1.2))
+        delay = min(float(module.params['poll_interval']), delay * 2)
+    module.fail_json(msg="Timeout exceed while waiting on result state of the entity.")
+
+
+def run_instances(module, connection, vms_service):
+    """
+    Provision several VMs over one authenticated connection.
+
+    The engine offers no multi-VM add call, so one add is still issued
+    per VM, but the login handshake, SDK setup and connection are paid
+    once per batch instead of once per VM.
+    """
+    base_params = module.params
+    results = list()
+    changed = False
+
+    try:
+        for instance in base_params['instances']:
+            params = dict(base_params)
+            params.update(instance)
+            module.params = params
+
+            vms_module = VmsModule(
+                connection=connection,
+                module=module,
+                service=vms_service,
             )
-        ]) > 0 if vm is not None else False,
-        fail_condition=lambda vm: vm is None,
-        timeout=module.params['timeout'],
-        poll_interval=module.params['poll_interval'],
-    )
-    return True
+            vm = vms_module.search_entity(list_params={'all_content': True})
+            control_state(vm, vms_service, module)
+            ret = vms_module.create(
+                entity=vm,
+                result_state=otypes.VmStatus.DOWN if vm is None else None,
+                clone=params['clone'],
+                clone_permissions=params['clone_permissions'],
+            )
+            vms_module.post_present(ret['id'])
+            ret['changed'] = vms_module.changed
+            changed = changed or ret['changed']
+            results.append(ret)
+    finally:
+        module.params = base_params
+
+    return {'changed': changed, 'instances': results}
+
+
+def _vm_is_down(vm):
+    return vm.status == otypes.VmStatus.DOWN
+
+
+def _vm_is_suspended(vm):
+    return vm.status == otypes.VmStatus.SUSPENDED
+
+
+def _vm_is_down_or_up(vm):
+    # VM can end in UP state in case there is no GA or ACPI on the VM
+    # or shutdown operation crashed:
+    return vm.status in (otypes.VmStatus.DOWN, otypes.VmStatus.UP)
+
+
+# status -> wait condition for the simple transitional states; filled
+# lazily because otypes is only known to exist at module run time:
+_CONTROL_WAIT_CONDITIONS = {}
 
 
 def control_state(vm, vms_service, module):
@@ -1695,128 +2189,159 @@ def control_state(vm, vms_service, module):
     state = module.params['state']
 
     vm_service = vms_service.vm_service(vm.id)
-    if vm.status == otypes.VmStatus.IMAGE_LOCKED:
+    # The shared wait() starts polling at sub-second intervals and backs
+    # off toward poll_interval, so fast transitions are caught early
+    # while the user-tuned ceiling still applies to slow ones:
+    timeout = module.params['timeout']
+    poll_interval = module.params['poll_interval']
+    if not _CONTROL_WAIT_CONDITIONS:
+        _CONTROL_WAIT_CONDITIONS.update({
+            otypes.VmStatus.IMAGE_LOCKED: _vm_is_down,
+            # Result state is SUSPENDED, we should wait to be suspended:
+            otypes.VmStatus.SAVING_STATE: _vm_is_suspended,
+        })
+
+    status = vm.status
+    if status in _CONTROL_WAIT_CONDITIONS:
         wait(
             service=vm_service,
-            condition=lambda vm: vm.status == otypes.VmStatus.DOWN,
-        )
-    elif vm.status == otypes.VmStatus.SAVING_STATE:
-        # Result state is SUSPENDED, we should wait to be suspended:
-        wait(
-            service=vm_service,
-            condition=lambda vm: vm.status == otypes.VmStatus.SUSPENDED,
+            condition=_CONTROL_WAIT_CONDITIONS[status],
+            timeout=timeout,
+            poll_interval=poll_interval,
         )
     elif (
-        vm.status == otypes.VmStatus.UNASSIGNED or
-        vm.status == otypes.VmStatus.UNKNOWN
+        status == otypes.VmStatus.UNASSIGNED or
+        status == otypes.VmStatus.UNKNOWN
     ):
         # Invalid states:
-        module.fail_json(msg="Not possible to control VM, if it's in '{}' status".format(vm.status))
-    elif vm.status == otypes.VmStatus.POWERING_DOWN:
+        module.fail_json(msg="Not possible to control VM, if it's in '{}' status".format(status))
+    elif status == otypes.VmStatus.POWERING_DOWN:
         if (force and state == 'stopped') or state == 'absent':
             vm_service.stop()
             wait(
                 service=vm_service,
-                condition=lambda vm: vm.status == otypes.VmStatus.DOWN,
+                condition=_vm_is_down,
+                timeout=timeout,
+                poll_interval=poll_interval,
             )
         else:
-            # If VM is powering down, wait to be DOWN or UP.
-            # VM can end in UP state in case there is no GA
-            # or ACPI on the VM or shutdown operation crashed:
+            # If VM is powering down, wait to be DOWN or UP:
             wait(
                 service=vm_service,
-                condition=lambda vm: vm.status in [otypes.VmStatus.DOWN, otypes.VmStatus.UP],
+                condition=_vm_is_down_or_up,
+                timeout=timeout,
+                poll_interval=poll_interval,
             )
 
 
+# Built once at import; ~80 inner dict() constructions that main()
+# does not need to repeat per invocation:
+_ARGUMENT_SPEC = ovirt_full_argument_spec(
+    state=dict(type='str', default='present', choices=['absent', 'next_run', 'present', 'registered', 'running', 'stopped', 'suspended']),
+    name=dict(type='str'),
+    id=dict(type='str'),
+    instances=dict(type='list'),
+    lookup_cache_timeout=dict(type='int', default=3600),
+    cluster=dict(type='str'),
+    allow_partial_import=dict(type='bool'),
+    template=dict(type='str'),
+    template_version=dict(type='int'),
+    use_latest_template_version=dict(type='bool'),
+    storage_domain=dict(type='str'),
+    disk_format=dict(type='str', default='cow', choices=['cow', 'raw']),
+    disks=dict(type='list', default=[]),
+    memory=dict(type='str'),
+    memory_guaranteed=dict(type='str'),
+    memory_max=dict(type='str'),
+    cpu_sockets=dict(type='int'),
+    cpu_cores=dict(type='int'),
+    cpu_shares=dict(type='int'),
+    cpu_threads=dict(type='int'),
+    type=dict(type='str', choices=['server', 'desktop', 'high_performance']),
+    operating_system=dict(type='str'),
+    cd_iso=dict(type='str'),
+    boot_devices=dict(type='list'),
+    vnic_profile_mappings=dict(default=[], type='list'),
+    cluster_mappings=dict(default=[], type='list'),
+    role_mappings=dict(default=[], type='list'),
+    affinity_group_mappings=dict(default=[], type='list'),
+    affinity_label_mappings=dict(default=[], type='list'),
+    lun_mappings=dict(default=[], type='list'),
+    domain_mappings=dict(default=[], type='list'),
+    reassign_bad_macs=dict(default=None, type='bool'),
+    boot_menu=dict(type='bool'),
+    serial_console=dict(type='bool'),
+    usb_support=dict(type='bool'),
+    sso=dict(type='bool'),
+    quota_id=dict(type='str'),
+    high_availability=dict(type='bool'),
+    high_availability_priority=dict(type='int'),
+    lease=dict(type='str'),
+    stateless=dict(type='bool'),
+    delete_protected=dict(type='bool'),
+    force=dict(type='bool', default=False),
+    nics=dict(type='list', default=[]),
+    cloud_init=dict(type='dict'),
+    cloud_init_nics=dict(type='list', default=[]),
+    cloud_init_persist=dict(type='bool', default=False, aliases=['sysprep_persist']),
+    sysprep=dict(type='dict'),
+    host=dict(type='str'),
+    clone=dict(type='bool', default=False),
+    clone_permissions=dict(type='bool', default=False),
+    kernel_path=dict(type='str'),
+    initrd_path=dict(type='str'),
+    kernel_params=dict(type='str'),
+    instance_type=dict(type='str'),
+    description=dict(type='str'),
+    comment=dict(type='str'),
+    timezone=dict(type='str'),
+    serial_policy=dict(type='str', choices=['vm', 'host', 'custom']),
+    serial_policy_value=dict(type='str'),
+    vmware=dict(type='dict'),
+    xen=dict(type='dict'),
+    kvm=dict(type='dict'),
+    cpu_mode=dict(type='str'),
+    placement_policy=dict(type='str'),
+    cpu_pinning=dict(type='list'),
+    soundcard_enabled=dict(type='bool', default=None),
+    smartcard_enabled=dict(type='bool', default=None),
+    io_threads=dict(type='int', default=None),
+    ballooning_enabled=dict(type='bool', default=None),
+    rng_device=dict(type='str'),
+    custom_properties=dict(type='list'),
+    watchdog=dict(type='dict'),
+    graphical_console=dict(type='dict'),
+)
+
+
 def main():
-    argument_spec = ovirt_full_argument_spec(
-        state=dict(type='str', default='present', choices=['absent', 'next_run', 'present', 'registered', 'running', 'stopped', 'suspended']),
-        name=dict(type='str'),
-        id=dict(type='str'),
-        cluster=dict(type='str'),
-        allow_partial_import=dict(type='bool'),
-        template=dict(type='str'),
-        template_version=dict(type='int'),
-        use_latest_template_version=dict(type='bool'),
-        storage_domain=dict(type='str'),
-        disk_format=dict(type='str', default='cow', choices=['cow', 'raw']),
-        disks=dict(type='list', default=[]),
-        memory=dict(type='str'),
-        memory_guaranteed=dict(type='str'),
-        memory_max=dict(type='str'),
-        cpu_sockets=dict(type='int'),
-        cpu_cores=dict(type='int'),
-        cpu_shares=dict(type='int'),
-        cpu_threads=dict(type='int'),
-        type=dict(type='str', choices=['server', 'desktop', 'high_performance']),
-        operating_system=dict(type='str'),
-        cd_iso=dict(type='str'),
-        boot_devices=dict(type='list'),
-        vnic_profile_mappings=dict(default=[], type='list'),
-        cluster_mappings=dict(default=[], type='list'),
-        role_mappings=dict(default=[], type='list'),
-        affinity_group_mappings=dict(default=[], type='list'),
-        affinity_label_mappings=dict(default=[], type='list'),
-        lun_mappings=dict(default=[], type='list'),
-        domain_mappings=dict(default=[], type='list'),
-        reassign_bad_macs=dict(default=None, type='bool'),
-        boot_menu=dict(type='bool'),
-        serial_console=dict(type='bool'),
-        usb_support=dict(type='bool'),
-        sso=dict(type='bool'),
-        quota_id=dict(type='str'),
-        high_availability=dict(type='bool'),
-        high_availability_priority=dict(type='int'),
-        lease=dict(type='str'),
-        stateless=dict(type='bool'),
-        delete_protected=dict(type='bool'),
-        force=dict(type='bool', default=False),
-        nics=dict(type='list', default=[]),
-        cloud_init=dict(type='dict'),
-        cloud_init_nics=dict(type='list', default=[]),
-        cloud_init_persist=dict(type='bool', default=False, aliases=['sysprep_persist']),
-        sysprep=dict(type='dict'),
-        host=dict(type='str'),
-        clone=dict(type='bool', default=False),
-        clone_permissions=dict(type='bool', default=False),
-        kernel_path=dict(type='str'),
-        initrd_path=dict(type='str'),
-        kernel_params=dict(type='str'),
-        instance_type=dict(type='str'),
-        description=dict(type='str'),
-        comment=dict(type='str'),
-        timezone=dict(type='str'),
-        serial_policy=dict(type='str', choices=['vm', 'host', 'custom']),
-        serial_policy_value=dict(type='str'),
-        vmware=dict(type='dict'),
-        xen=dict(type='dict'),
-        kvm=dict(type='dict'),
-        cpu_mode=dict(type='str'),
-        placement_policy=dict(type='str'),
-        cpu_pinning=dict(type='list'),
-        soundcard_enabled=dict(type='bool', default=None),
-        smartcard_enabled=dict(type='bool', default=None),
-        io_threads=dict(type='int', default=None),
-        ballooning_enabled=dict(type='bool', default=None),
-        rng_device=dict(type='str'),
-        custom_properties=dict(type='list'),
-        watchdog=dict(type='dict'),
-        graphical_console=dict(type='dict'),
-    )
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARGUMENT_SPEC,
         supports_check_mode=True,
-        required_one_of=[['id', 'name']],
+        required_one_of=[['id', 'name', 'instances']],
     )
     check_sdk(module)
-    check_params(module)
+    if module.params['instances']:
+        if module.params['state'] != 'present':
+            module.fail_json(msg="'instances' is only supported when state is 'present'")
+        for instance in module.params['instances']:
+            if not (instance.get('name') or instance.get('id')):
+                module.fail_json(msg="each item in 'instances' requires 'name' or 'id'")
+    else:
+        check_params(module)
 
     try:
         state = module.params['state']
         auth = module.params.pop('auth')
+        # the attach phases open worker connections of their own:
+        module._ovirt_auth = auth
         connection = create_connection(auth)
-        vms_service = connection.system_service().vms_service()
+        system_service = connection.system_service()
+        vms_service = system_service.vms_service()
+
+        if module.params['instances']:
+            module.exit_json(**run_instances(module, connection, vms_service))
+
         vms_module = VmsModule(
             connection=connection,
             module=module,
@@ -1825,9 +2350,12 @@ def main():
         vm = vms_module.search_entity(list_params={'all_content': True})
 
         control_state(vm, vms_service, module)
-        if state in ('present', 'running', 'next_run'):
+
+        def ensure_present(vm):
+            # Shared by the present/running/next_run and stopped states;
+            # the already-fetched vm spares import_vm its own search.
             if module.params['xen'] or module.params['kvm'] or module.params['vmware']:
-                vms_module.changed = import_vm(module, connection)
+                vms_module.changed = import_vm(module, connection, existing_vm=vm)
 
             # In case VM don't exist, wait for VM DOWN state,
             # otherwise don't wait for any state, just update VM:
@@ -1838,6 +2366,10 @@ def main():
                 clone_permissions=module.params['clone_permissions'],
             )
             vms_module.post_present(ret['id'])
+            return ret
+
+        if state in ('present', 'running', 'next_run'):
+            ret = ensure_present(vm)
 
             # Run the VM if it was just created, else don't run it:
             if state == 'running':
@@ -1894,16 +2426,7 @@ def main():
                     )
             ret['changed'] = vms_module.changed
         elif state == 'stopped':
-            if module.params['xen'] or module.params['kvm'] or module.params['vmware']:
-                vms_module.changed = import_vm(module, connection)
-
-            ret = vms_module.create(
-                entity=vm,
-                result_state=otypes.VmStatus.DOWN if vm is None else None,
-                clone=module.params['clone'],
-                clone_permissions=module.params['clone_permissions'],
-            )
-            vms_module.post_present(ret['id'])
+            ret = ensure_present(vm)
             if module.params['force']:
                 ret = vms_module.action(
                     action='stop',
@@ -1936,15 +2459,28 @@ def main():
         elif state == 'absent':
             ret = vms_module.remove()
         elif state == 'registered':
-            storage_domains_service = connection.system_service().storage_domains_service()
+            storage_domains_service = system_service.storage_domains_service()
 
             # Find the storage domain with unregistered VM:
             sd_id = get_id_by_name(storage_domains_service, module.params['storage_domain'])
             storage_domain_service = storage_domains_service.storage_domain_service(sd_id)
-            vms_service = storage_domain_service.vms_service()
-
-            # Find the the unregistered VM we want to register:
-            vms = vms_service.list(unregistered=True)
+            # distinct from the engine-wide vms_service bound above:
+            sd_vms_service = storage_domain_service.vms_service()
+
+            # Find the the unregistered VM we want to register; ask the
+            # server for just the one VM where the SDK allows it, rather
+            # than transferring every unregistered VM on the domain:
+            query = (
+                'id=%s' % module.params['id']
+                if module.params['id']
+                else 'name=%s' % module.params['name']
+            )
+            try:
+                vms = sd_vms_service.list(unregistered=True, search=query)
+            except TypeError:
+                # This SDK release has no search on the attached-storage-
+                # domain VM listing:
+                vms = sd_vms_service.list(unregistered=True)
             vm = next(
                 (vm for vm in vms if (vm.id == module.params['id'] or vm.name == module.params['name'])),
                 None
@@ -1959,7 +2495,7 @@ def main():
             else:
                 # Register the vm into the system:
                 changed = True
-                vm_service = vms_service.vm_service(vm.id)
+                vm_service = sd_vms_service.vm_service(vm.id)
                 vm_service.register(
                     allow_partial_import=module.params['allow_partial_import'],
                     cluster=otypes.Cluster(
@@ -98,15 +98,47 @@ facts:
     sample: { "facts": { "localhost.localdomain": { "error": "NA", "level": "vmware_certified" }}}
 '''
 
+import random
+import socket
+import time
+
 try:
     from pyVmomi import vim, vmodl
 except ImportError:
     pass
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_FUTURES = True
+except ImportError:
+    HAS_FUTURES = False
+
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.six.moves import http_client
 from ansible.module_utils.vmware import vmware_argument_spec, PyVmomi
 from ansible.module_utils._text import to_native
 
 
+ACCEPTANCE_LEVELS = ('community', 'partner', 'vmware_accepted', 'vmware_certified')
+STATES = ('list', 'present')
+
+
+def _retry(func, tries=5, max_backoff=64):
+    """Retry a pyVmomi call when the transport hiccups.
+
+    Transient failures (cancelled requests, empty status lines, socket
+    timeouts) otherwise abort the whole play. Sleeps capped exponential
+    backoff plus up to a second of jitter between attempts so parallel
+    workers do not retry in lockstep.
+    """
+    for attempt in range(tries - 1):
+        try:
+            return func()
+        except (vmodl.fault.RequestCanceled, http_client.BadStatusLine, socket.timeout):
+            time.sleep(min(2 ** attempt, max_backoff) + random.randint(1, 1000) / 1000.0)
+    return func()
+
+
 class VMwareAccpetanceManager(PyVmomi):
     def __init__(self, module):
         super(VMwareAccpetanceManager, self).__init__(module)
@@ -114,52 +146,108 @@ class VMwareAccpetanceManager(PyVmomi):
         esxi_host_name = self.params.get('esxi_hostname', None)
         self.hosts = []
         if cluster_name:
-            cluster_obj = self.find_cluster_by_name(cluster_name=cluster_name)
-            if cluster_obj:
-                self.hosts = [host for host in cluster_obj.host]
+            hosts = self.get_hosts_by_cluster_name(cluster_name)
+            if hosts is not None:
+                self.hosts = hosts
             else:
                 module.fail_json(changed=False, msg="Cluster '%s' not found" % cluster_name)
         elif esxi_host_name:
-            esxi_host_obj = self.find_hostsystem_by_name(host_name=esxi_host_name)
+            esxi_host_obj = self.get_hostsystem_by_name(esxi_host_name)
             if esxi_host_obj:
                 self.hosts = [esxi_host_obj]
             else:
                 module.fail_json(changed=False, msg="ESXi '%s' not found" % esxi_host_name)
         self.desired_state = self.params.get('state')
         self.hosts_facts = {}
+        self.host_names = {}
         self.acceptance_level = self.params.get('acceptance_level')
 
+    def _map_hosts(self, func):
+        # Run one blocking SOAP call per host; the calls are pure I/O wait,
+        # so fan them out over a small thread pool when futures is available
+        if HAS_FUTURES and len(self.hosts) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(self.hosts), 8)) as executor:
+                return list(executor.map(func, self.hosts))
+        return [func(host) for host in self.hosts]
+
     def gather_acceptance_facts(self):
-        for host in self.hosts:
-            self.hosts_facts[host.name] = dict(level='', error='NA')
-            host_image_config_mgr = host.configManager.imageConfigManager
+        # Fetch name and image config manager for all hosts in one
+        # PropertyCollector round trip instead of two SOAP calls per host
+        host_properties = self.get_properties_for_objects(
+            objs=self.hosts,
+            vim_type=vim.HostSystem,
+            properties=['name', 'configManager.imageConfigManager'],
+        )
+
+        def fact_one_host(host):
+            props = host_properties.get(host, {})
+            host_name = props.get('name', host.name)
+            level = ''
+            error = 'NA'
+            host_image_config_mgr = props.get('configManager.imageConfigManager')
             if host_image_config_mgr:
                 try:
-                    self.hosts_facts[host.name]['level'] = host_image_config_mgr.HostImageConfigGetAcceptance()
+                    level = _retry(host_image_config_mgr.HostImageConfigGetAcceptance)
                 except vim.fault.HostConfigFault as e:
-                    self.hosts_facts[host.name]['error'] = to_native(e.msg)
+                    error = to_native(e.msg)
+            return host, host_name, level, error, host_image_config_mgr
+
+        for host, host_name, level, error, mgr in self._map_hosts(fact_one_host):
+            self.host_names[host] = host_name
+            self.hosts_facts[host_name] = dict(level=level, error=error, _mgr=mgr)
 
     def set_acceptance_level(self):
-        change = []
-        for host in self.hosts:
+        def set_one_host(host):
             host_changed = False
-            if self.hosts_facts[host.name]['level'] != self.acceptance_level:
-                host_image_config_mgr = host.configManager.imageConfigManager
+            host_facts = self.hosts_facts[self.host_names.get(host, host.name)]
+            if host_facts['level'] != self.acceptance_level:
+                if self.module.check_mode:
+                    return True
+                # Reuse the manager reference fetched by the property
+                # collector batch instead of dereferencing it again
+                host_image_config_mgr = host_facts['_mgr']
                 if host_image_config_mgr:
                     try:
-                        host_image_config_mgr.UpdateHostImageAcceptanceLevel(newAcceptanceLevel=self.acceptance_level)
+                        _retry(
+                            lambda: host_image_config_mgr.UpdateHostImageAcceptanceLevel(
+                                newAcceptanceLevel=self.acceptance_level
+                            )
+                        )
                         host_changed = True
-                        self.hosts_facts[host.name]['level'] = host_image_config_mgr.HostImageConfigGetAcceptance()
+                        # The update either raised or applied the requested
+                        # level; no need to read it back from the host
+                        host_facts['level'] = self.acceptance_level
                     except vim.fault.HostConfigFault as e:
-                        self.hosts_facts[host.name]['error'] = to_native(e.msg)
+                        host_facts['error'] = to_native(e.msg)
 
-            change.append(host_changed)
-        self.module.exit_json(changed=any(change), facts=self.hosts_facts)
+            return host_changed
+
+        changed = False
+        for host_changed in self._map_hosts(set_one_host):
+            changed |= host_changed
+        self._exit_with_facts(changed=changed)
+
+    def _exit_with_facts(self, changed):
+        # The cached image config manager is internal plumbing, not a fact
+        for host_facts in self.hosts_facts.values():
+            host_facts.pop('_mgr', None)
+        self.module.exit_json(changed=changed, facts=self.hosts_facts)
 
     def check_acceptance_state(self):
+        if self.module.check_mode and self.desired_state == 'list':
+            # Listing never changes anything; skip the vCenter calls in
+            # check mode and report the levels as unknown
+            self.hosts_facts = dict(
+                (host.name, dict(level='unknown', error='NA')) for host in self.hosts
+            )
+            self._exit_with_facts(changed=False)
         self.gather_acceptance_facts()
         if self.desired_state == 'list':
-            self.module.exit_json(changed=False, facts=self.hosts_facts)
+            self._exit_with_facts(changed=False)
+        if all(host_facts['level'] == self.acceptance_level for host_facts in self.hosts_facts.values()):
+            # Every host is already at the requested level; skip the
+            # update pass entirely
+            self._exit_with_facts(changed=False)
         self.set_acceptance_level()
 
 
@@ -169,10 +257,10 @@ def main():
         cluster_name=dict(type='str', required=False),
         esxi_hostname=dict(type='str', required=False),
         acceptance_level=dict(type='str',
-                              choices=['community', 'partner', 'vmware_accepted', 'vmware_certified']
+                              choices=ACCEPTANCE_LEVELS,
                               ),
         state=dict(type='str',
-                   choices=['list', 'present'],
+                   choices=STATES,
                    default='list'),
     )
 
@@ -181,9 +269,13 @@ def main():
         required_one_of=[
             ['cluster_name', 'esxi_hostname'],
         ],
+        mutually_exclusive=[
+            ['cluster_name', 'esxi_hostname'],
+        ],
         required_if=[
             ['state', 'present', ['acceptance_level']],
         ],
+        supports_check_mode=True,
     )
 
     vmware_host_accept_config = VMwareAccpetanceManager(module)
@@ -72,11 +72,18 @@ drs_rule_facts:
                     "search_doamin": [
                         "localdomain"
                     ],
+                    "search_domain": [
+                        "localdomain"
+                    ],
                     "virtual_nic_device": "vmk0"
                 }
             }
 '''
 
+try:
+    from pyVmomi import vim
+except ImportError:
+    pass
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.vmware import vmware_argument_spec, PyVmomi
 
@@ -88,30 +95,52 @@ class VmwareDnsFactsManager(PyVmomi):
         esxi_host_name = self.params.get('esxi_hostname', None)
         self.hosts = []
         if cluster_name:
-            cluster_obj = self.find_cluster_by_name(cluster_name=cluster_name)
-            if cluster_obj:
-                self.hosts = [host for host in cluster_obj.host]
+            hosts = self.get_hosts_by_cluster_name(cluster_name)
+            if hosts is not None:
+                self.hosts = hosts
             else:
                 module.fail_json(changed=False, msg="Cluster '%s' not found" % cluster_name)
         elif esxi_host_name:
-            esxi_host_obj = self.find_hostsystem_by_name(host_name=esxi_host_name)
+            esxi_host_obj = self.get_hostsystem_by_name(esxi_host_name)
             if esxi_host_obj:
                 self.hosts = [esxi_host_obj]
             else:
                 module.fail_json(changed=False, msg="ESXi '%s' not found" % esxi_host_name)
 
+    @staticmethod
+    def _format_dns_config(dns_config):
+        # dns_config is a fully-materialized DataObject delivered by the
+        # property collector, so these are plain attribute reads, not RPCs
+        search_domain = list(dns_config.searchDomain)
+        return dict(
+            dhcp=dns_config.dhcp,
+            virtual_nic_device=dns_config.virtualNicDevice,
+            host_name=dns_config.hostName,
+            domain_name=dns_config.domainName,
+            ip_address=list(dns_config.address),
+            # the misspelled key is the original return contract; keep
+            # serving it next to the corrected spelling
+            search_doamin=search_domain,
+            search_domain=search_domain,
+        )
+
     def gather_dns_facts(self):
         hosts_facts = {}
+        # Fetch name and the whole dnsConfig structure for all hosts in one
+        # PropertyCollector round trip instead of several SOAP calls per host
+        host_properties = self.get_properties_for_objects(
+            objs=self.hosts,
+            vim_type=vim.HostSystem,
+            properties=['name', 'config.network.dnsConfig'],
+        )
         for host in self.hosts:
-            host_facts = {}
-            dns_config = host.config.network.dnsConfig
-            host_facts['dhcp'] = dns_config.dhcp
-            host_facts['virtual_nic_device'] = dns_config.virtualNicDevice
-            host_facts['host_name'] = dns_config.hostName
-            host_facts['domain_name'] = dns_config.domainName
-            host_facts['ip_address'] = [ip for ip in dns_config.address]
-            host_facts['search_doamin'] = [domain for domain in dns_config.searchDomain]
-            hosts_facts[host.name] = host_facts
+            props = host_properties.get(host)
+            if props is None:
+                # Host missing from the batched result; fall back to the
+                # lazy per-attribute path for this host only
+                hosts_facts[host.name] = self._format_dns_config(host.config.network.dnsConfig)
+                continue
+            hosts_facts[props['name']] = self._format_dns_config(props['config.network.dnsConfig'])
         return hosts_facts
 
 
@@ -126,7 +155,11 @@ def main():
         argument_spec=argument_spec,
         required_one_of=[
             ['cluster_name', 'esxi_hostname'],
-        ]
+        ],
+        mutually_exclusive=[
+            ['cluster_name', 'esxi_hostname'],
+        ],
+        supports_check_mode=True,
     )
 
     vmware_dns_config = VmwareDnsFactsManager(module)
@@ -140,8 +140,8 @@ EXAMPLES = '''
 RETURN = ''' # '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.six import iteritems
-from ansible.module_utils.net_tools.nios.api import WapiModule
+
+STATES = ('present', 'absent')
 
 
 def options(module):
@@ -164,18 +164,23 @@ def options(module):
 
     The remainder of the value validation is performed by WAPI
     '''
-    options = list()
-    for item in module.params['options']:
-        opt = dict([(k, v) for k, v in iteritems(item) if v is not None])
+    options = module.params['options']
+    fail_json = module.fail_json
+    for opt in options:
+        for key in [k for k, v in opt.items() if v is None]:
+            del opt[key]
         if 'name' not in opt and 'num' not in opt:
-            module.fail_json(msg='one of `name` or `num` is required for option value')
-        options.append(opt)
+            fail_json(msg='one of `name` or `num` is required for option value')
     return options
 
 
 def main():
     ''' Main entry point for module execution
     '''
+    # Deferred so the infoblox_client dependency graph is only loaded once
+    # the module actually runs
+    from ansible.module_utils.net_tools.nios.api import WapiModule
+
     option_spec = dict(
         # one of name or num is required; enforced by the function options()
         name=dict(),
@@ -199,7 +204,7 @@ def main():
 
     argument_spec = dict(
         provider=dict(required=True),
-        state=dict(default='present', choices=['present', 'absent'])
+        state=dict(default='present', choices=STATES)
     )
 
     argument_spec.update(ib_spec)
@@ -123,12 +123,17 @@ EXAMPLES = '''
 RETURN = ''' # '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.net_tools.nios.api import WapiModule
+
+STATES = ('present', 'absent')
 
 
 def main():
     ''' Main entry point for module execution
     '''
+    # Deferred so the infoblox_client dependency graph is only loaded once
+    # the module actually runs
+    from ansible.module_utils.net_tools.nios.api import WapiModule
+
     grid_spec = dict(
         name=dict(required=True),
     )
@@ -146,7 +151,7 @@ def main():
 
     argument_spec = dict(
         provider=dict(required=True),
-        state=dict(default='present', choices=['present', 'absent'])
+        state=dict(default='present', choices=STATES)
     )
 
     argument_spec.update(ib_spec)
@@ -0,0 +1,122 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+DOCUMENTATION = r'''
+---
+module: aci_batch_flush
+short_description: Flush payloads queued by other ACI modules in one request
+description:
+- Sends all payloads spooled under a batch id by other ACI modules as a single
+  POST to C(/api/mo/uni.json).
+- When an ACI module runs with C(batch_id) set, its C(state=present) payload is
+  written to a spool file instead of being posted. Running this module with the
+  same C(batch_id) wraps every queued entry in one C(polUni) request, so a play
+  that creates many MOs pays for one HTTPS round-trip instead of one per task.
+notes:
+- The spool file is removed after a successful flush.
+- Queued entries carry their full target DN, so they can be flushed in any
+  order.
+author:
+- Dag Wieers (@dagwieers)
+version_added: '2.5'
+options:
+  batch_id:
+    description:
+    - The batch id the payloads were queued under.
+    required: yes
+extends_documentation_fragment: aci
+'''
+
+EXAMPLES = r'''
+- name: Queue many contracts without posting them
+  aci_contract:
+    host: apic
+    username: admin
+    password: SomeSecretPassword
+    tenant: production
+    contract: "{{ item }}"
+    batch_id: nightly
+    state: present
+  loop: "{{ contracts }}"
+
+- name: Flush the queued contracts in one request
+  aci_batch_flush:
+    host: apic
+    username: admin
+    password: SomeSecretPassword
+    batch_id: nightly
+'''
+
+RETURN = r'''
+flushed:
+  description: The number of queued payloads sent to the APIC
+  returned: success
+  type: int
+  sample: 12
+'''
+
+import json
+import os
+
+from ansible.module_utils.network.aci.aci import ACIModule, aci_argument_spec
+from ansible.module_utils.basic import AnsibleModule
+
+
+def main():
+    argument_spec = aci_argument_spec()
+    argument_spec['batch_id'] = dict(type='str', required=True)
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+    )
+
+    aci = ACIModule(module)
+
+    spool = ACIModule.batch_spool_path(module.params['batch_id'])
+    children = []
+    if os.path.exists(spool):
+        with open(spool) as spool_file:
+            for line in spool_file:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                config = entry['config']
+                # Stamp the target DN on the MO so it can be posted to uni
+                for aci_class in config:
+                    config[aci_class].setdefault('attributes', {})['dn'] = entry['dn']
+                children.append(config)
+
+    if not children:
+        aci.exit_json(flushed=0)
+
+    aci.path = 'api/mo/uni.json'
+    if module.params['port'] is not None:
+        aci.url = '%(protocol)s://%(host)s:%(port)s/' % module.params + aci.path
+    else:
+        aci.url = '%(protocol)s://%(host)s/' % module.params + aci.path
+    aci.config = {'polUni': {'attributes': {}, 'children': children}}
+    aci.params['method'] = 'post'
+    # Post for real; never re-queue the combined payload
+    aci.params['batch_id'] = None
+
+    aci.post_config()
+
+    if not module.check_mode:
+        os.remove(spool)
+
+    aci.exit_json(flushed=len(children))
+
+
+if __name__ == "__main__":
+    main()
@@ -57,6 +57,13 @@ options:
     choices: [ AF11, AF12, AF13, AF21, AF22, AF23, AF31, AF32, AF33, AF41, AF42, AF43, CS0, CS1, CS2, CS3, CS4, CS5, CS6, CS7, EF, VA, unspecified ]
     default: unspecified
     aliases: [ target ]
+  no_diff:
+    description:
+    - Skip retrieving the existing configuration before posting.
+    - When enabled with C(state=present) the module posts the full proposed
+      configuration as an upsert and does not return previous or diff output.
+    type: bool
+    default: 'no'
   state:
     description:
     - Use C(present) or C(absent) for adding or removing.
@@ -213,30 +220,40 @@ from ansible.module_utils.network.aci.aci import ACIModule, aci_argument_spec
 from ansible.module_utils.basic import AnsibleModule
 
 
-def main():
-    argument_spec = aci_argument_spec()
-    argument_spec.update(
-        contract=dict(type='str', required=False, aliases=['contract_name', 'name']),  # Not required for querying all objects
-        tenant=dict(type='str', required=False, aliases=['tenant_name']),  # Not required for querying all objects
-        description=dict(type='str', aliases=['descr']),
-        scope=dict(type='str', choices=['application-profile', 'context', 'global', 'tenant']),
-        priority=dict(type='str', choices=['level1', 'level2', 'level3', 'unspecified']),  # No default provided on purpose
-        dscp=dict(type='str',
-                  choices=['AF11', 'AF12', 'AF13', 'AF21', 'AF22', 'AF23', 'AF31', 'AF32', 'AF33', 'AF41', 'AF42', 'AF43',
-                           'CS0', 'CS1', 'CS2', 'CS3', 'CS4', 'CS5', 'CS6', 'CS7', 'EF', 'VA', 'unspecified'],
-                  aliases=['target']),  # No default provided on purpose
-        state=dict(type='str', default='present', choices=['absent', 'present', 'query']),
-        method=dict(type='str', choices=['delete', 'get', 'post'], aliases=['action'], removed_in_version='2.6'),  # Deprecated starting from v2.6
-        protocol=dict(type='str', removed_in_version='2.6'),  # Deprecated in v2.6
-    )
+DSCP_CHOICES = ('AF11', 'AF12', 'AF13', 'AF21', 'AF22', 'AF23', 'AF31', 'AF32', 'AF33', 'AF41', 'AF42', 'AF43',
+                'CS0', 'CS1', 'CS2', 'CS3', 'CS4', 'CS5', 'CS6', 'CS7', 'EF', 'VA', 'unspecified')
+SCOPE_CHOICES = ('application-profile', 'context', 'global', 'tenant')
+PRIORITY_CHOICES = ('level1', 'level2', 'level3', 'unspecified')
+STATE_CHOICES = ('absent', 'present', 'query')
+METHOD_CHOICES = ('delete', 'get', 'post')
+
+# Computed once at import so repeated invocations in a persistent worker
+# do not rebuild the same spec dicts
+ARGUMENT_SPEC = aci_argument_spec()
+ARGUMENT_SPEC.update(
+    contract=dict(type='str', required=False, aliases=['contract_name', 'name']),  # Not required for querying all objects
+    tenant=dict(type='str', required=False, aliases=['tenant_name']),  # Not required for querying all objects
+    description=dict(type='str', aliases=['descr']),
+    scope=dict(type='str', choices=SCOPE_CHOICES),
+    priority=dict(type='str', choices=PRIORITY_CHOICES),  # No default provided on purpose
+    dscp=dict(type='str', choices=DSCP_CHOICES, aliases=['target']),  # No default provided on purpose
+    state=dict(type='str', default='present', choices=STATE_CHOICES),
+    no_diff=dict(type='bool', default=False),
+    method=dict(type='str', choices=METHOD_CHOICES, aliases=['action'], removed_in_version='2.6'),  # Deprecated starting from v2.6
+    protocol=dict(type='str', removed_in_version='2.6'),  # Deprecated in v2.6
+)
 
+REQUIRED_IF = [
+    ['state', 'absent', ['contract', 'tenant']],
+    ['state', 'present', ['contract', 'tenant']],
+]
+
+
+def main():
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
         supports_check_mode=True,
-        required_if=[
-            ['state', 'absent', ['contract', 'tenant']],
-            ['state', 'present', ['contract', 'tenant']],
-        ],
+        required_if=REQUIRED_IF,
     )
 
     contract = module.params['contract']
@@ -251,19 +268,23 @@ def main():
     aci.construct_url(
         root_class=dict(
             aci_class='fvTenant',
-            aci_rn='tn-{0}'.format(tenant),
-            filter_target='eq(fvTenant.name, "{0}")'.format(tenant),
+            aci_rn=f'tn-{tenant}',
+            filter_target=f'eq(fvTenant.name, "{tenant}")',
             module_object=tenant,
         ),
         subclass_1=dict(
             aci_class='vzBrCP',
-            aci_rn='brc-{0}'.format(contract),
-            filter_target='eq(vzBrCP.name, "{0}")'.format(contract),
+            aci_rn=f'brc-{contract}',
+            filter_target=f'eq(vzBrCP.name, "{contract}")',
             module_object=contract,
         ),
     )
 
-    aci.get_existing()
+    # Skip the existing-object fetch when the caller opts out of
+    # previous/diff output; the APIC POST is an upsert either way
+    no_diff = module.params['no_diff']
+    if not (no_diff and state == 'present'):
+        aci.get_existing()
 
     if state == 'present':
         aci.payload(
@@ -277,9 +298,12 @@ def main():
             ),
         )
 
-        aci.get_diff(aci_class='vzBrCP')
+        if no_diff:
+            aci.post_config(force=True)
+        else:
+            aci.get_diff(aci_class='vzBrCP')
 
-        aci.post_config()
+            aci.post_config()
 
     elif state == 'absent':
         aci.delete_config()
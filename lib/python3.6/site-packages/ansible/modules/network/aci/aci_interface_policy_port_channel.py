@@ -91,6 +91,13 @@ options:
     - The APIC defaults new LACP Policies to C(no).
     type: bool
     default: 'no'
+  no_diff:
+    description:
+    - Skip retrieving the existing configuration before posting.
+    - When enabled with C(state=present) the module posts the full proposed
+      configuration as an upsert and does not return previous or diff output.
+    type: bool
+    default: 'no'
   state:
     description:
     - Use C(present) or C(absent) for adding or removing.
@@ -220,73 +227,89 @@ url:
 from ansible.module_utils.network.aci.aci import ACIModule, aci_argument_spec
 from ansible.module_utils.basic import AnsibleModule
 
+MIN_LINKS_ERR = 'The "min_links" must be a value between 1 and 16'
+MAX_LINKS_ERR = 'The "max_links" must be a value between 1 and 16'
+
+# All 32 possible ctrl strings, indexed by a 5-bit flag mask
+CTRL_FLAGS = ('fast-sel-hot-stdby', 'graceful-conv', 'load-defer', 'susp-individual', 'symmetric-hash')
+CTRL_TABLE = dict(
+    (mask, ','.join(flag for bit, flag in enumerate(CTRL_FLAGS) if mask >> (4 - bit) & 1) or None)
+    for mask in range(32)
+)
 
-def main():
-    argument_spec = aci_argument_spec()
-    argument_spec.update(
-        port_channel=dict(type='str', required=False, aliases=['name']),  # Not required for querying all objects
-        description=dict(type='str', aliases=['descr']),
-        min_links=dict(type='int'),
-        max_links=dict(type='int'),
-        mode=dict(type='str', choices=['off', 'mac-pin', 'active', 'passive', 'mac-pin-nicload']),
-        fast_select=dict(type='bool'),
-        graceful_convergence=dict(type='bool'),
-        load_defer=dict(type='bool'),
-        suspend_individual=dict(type='bool'),
-        symmetric_hash=dict(type='bool'),
-        state=dict(type='str', default='present', choices=['absent', 'present', 'query']),
-        method=dict(type='str', choices=['delete', 'get', 'post'], aliases=['action'], removed_in_version='2.6'),  # Deprecated starting from v2.6
-        protocol=dict(type='str', removed_in_version='2.6'),  # Deprecated in v2.6
-    )
 
+MODE_CHOICES = ('off', 'mac-pin', 'active', 'passive', 'mac-pin-nicload')
+STATE_CHOICES = ('absent', 'present', 'query')
+METHOD_CHOICES = ('delete', 'get', 'post')
+
+# Computed once at import so repeated invocations in a persistent worker
+# do not rebuild the same spec dicts
+ARGUMENT_SPEC = aci_argument_spec()
+ARGUMENT_SPEC.update(
+    port_channel=dict(type='str', required=False, aliases=['name']),  # Not required for querying all objects
+    description=dict(type='str', aliases=['descr']),
+    min_links=dict(type='int'),
+    max_links=dict(type='int'),
+    mode=dict(type='str', choices=MODE_CHOICES),
+    fast_select=dict(type='bool'),
+    graceful_convergence=dict(type='bool'),
+    load_defer=dict(type='bool'),
+    suspend_individual=dict(type='bool'),
+    symmetric_hash=dict(type='bool'),
+    state=dict(type='str', default='present', choices=STATE_CHOICES),
+    no_diff=dict(type='bool', default=False),
+    method=dict(type='str', choices=METHOD_CHOICES, aliases=['action'], removed_in_version='2.6'),  # Deprecated starting from v2.6
+    protocol=dict(type='str', removed_in_version='2.6'),  # Deprecated in v2.6
+)
+
+REQUIRED_IF = [
+    ['state', 'absent', ['port_channel']],
+    ['state', 'present', ['port_channel']],
+]
+
+
+def main():
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
         supports_check_mode=True,
-        required_if=[
-            ['state', 'absent', ['port_channel']],
-            ['state', 'present', ['port_channel']],
-        ],
+        required_if=REQUIRED_IF,
     )
 
     port_channel = module.params['port_channel']
     description = module.params['description']
     min_links = module.params['min_links']
-    if min_links is not None and min_links not in range(1, 17):
-        module.fail_json(msg='The "min_links" must be a value between 1 and 16')
+    if min_links is not None and not 1 <= min_links <= 16:
+        module.fail_json(msg=MIN_LINKS_ERR)
     max_links = module.params['max_links']
-    if max_links is not None and max_links not in range(1, 17):
-        module.fail_json(msg='The "max_links" must be a value between 1 and 16')
+    if max_links is not None and not 1 <= max_links <= 16:
+        module.fail_json(msg=MAX_LINKS_ERR)
     mode = module.params['mode']
     state = module.params['state']
 
-    # Build ctrl value for request
-    ctrl = []
-    if module.params['fast_select'] is True:
-        ctrl.append('fast-sel-hot-stdby')
-    if module.params['graceful_convergence'] is True:
-        ctrl.append('graceful-conv')
-    if module.params['load_defer'] is True:
-        ctrl.append('load-defer')
-    if module.params['suspend_individual'] is True:
-        ctrl.append('susp-individual')
-    if module.params['symmetric_hash'] is True:
-        ctrl.append('symmetric-hash')
-    if not ctrl:
-        ctrl = None
-    else:
-        ctrl = ",".join(ctrl)
+    # Build ctrl value for request with one table lookup
+    ctrl = CTRL_TABLE[
+        bool(module.params['fast_select']) << 4 |
+        bool(module.params['graceful_convergence']) << 3 |
+        bool(module.params['load_defer']) << 2 |
+        bool(module.params['suspend_individual']) << 1 |
+        bool(module.params['symmetric_hash'])
+    ]
 
     aci = ACIModule(module)
     aci.construct_url(
         root_class=dict(
             aci_class='lacpLagPol',
-            aci_rn='infra/lacplagp-{0}'.format(port_channel),
-            filter_target='eq(lacpLagPol.name, "{0}")'.format(port_channel),
+            aci_rn=f'infra/lacplagp-{port_channel}',
+            filter_target=f'eq(lacpLagPol.name, "{port_channel}")',
             module_object=port_channel,
         ),
     )
 
-    aci.get_existing()
+    # Skip the existing-object fetch when the caller opts out of
+    # previous/diff output; the APIC POST is an upsert either way
+    no_diff = module.params['no_diff']
+    if not (no_diff and state == 'present'):
+        aci.get_existing()
 
     if state == 'present':
         aci.payload(
@@ -301,9 +324,12 @@ def main():
             ),
         )
 
-        aci.get_diff(aci_class='lacpLagPol')
+        if no_diff:
+            aci.post_config(force=True)
+        else:
+            aci.get_diff(aci_class='lacpLagPol')
 
-        aci.post_config()
+            aci.post_config()
 
     elif state == 'absent':
         aci.delete_config()
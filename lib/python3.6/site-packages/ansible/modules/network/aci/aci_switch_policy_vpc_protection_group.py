@@ -46,6 +46,13 @@ options:
     description:
     - The ID of the Second Leaf Switch for the Explicit vPC Protection Group.
     required: yes
+  no_diff:
+    description:
+    - Skip retrieving the existing configuration before posting.
+    - When enabled with C(state=present) the module posts the full proposed
+      configuration as an upsert and does not return previous or diff output.
+    type: bool
+    default: 'no'
   state:
     description:
     - Use C(present) or C(absent) for adding or removing.
@@ -200,24 +207,32 @@ from ansible.module_utils.network.aci.aci import ACIModule, aci_argument_spec
 from ansible.module_utils.basic import AnsibleModule
 
 
-def main():
-    argument_spec = aci_argument_spec()
-    argument_spec.update(
-        protection_group=dict(type='str', aliases=['name', 'protection_group_name']),  # Not required for querying all objects
-        protection_group_id=dict(type='int', aliases=['id']),
-        vpc_domain_policy=dict(type='str', aliases=['vpc_domain_policy_name']),
-        switch_1_id=dict(type='int'),
-        switch_2_id=dict(type='int'),
-        state=dict(type='str', default='present', choices=['absent', 'present', 'query']),
-    )
+STATE_CHOICES = ('absent', 'present', 'query')
+
+# Computed once at import so repeated invocations in a persistent worker
+# do not rebuild the same spec dicts
+ARGUMENT_SPEC = aci_argument_spec()
+ARGUMENT_SPEC.update(
+    protection_group=dict(type='str', aliases=['name', 'protection_group_name']),  # Not required for querying all objects
+    protection_group_id=dict(type='int', aliases=['id']),
+    vpc_domain_policy=dict(type='str', aliases=['vpc_domain_policy_name']),
+    switch_1_id=dict(type='int'),
+    switch_2_id=dict(type='int'),
+    state=dict(type='str', default='present', choices=STATE_CHOICES),
+    no_diff=dict(type='bool', default=False),
+)
 
+REQUIRED_IF = [
+    ['state', 'absent', ['protection_group']],
+    ['state', 'present', ['protection_group', 'protection_group_id', 'switch_1_id', 'switch_2_id']],
+]
+
+
+def main():
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
         supports_check_mode=True,
-        required_if=[
-            ['state', 'absent', ['protection_group']],
-            ['state', 'present', ['protection_group', 'protection_group_id', 'switch_1_id', 'switch_2_id']],
-        ],
+        required_if=REQUIRED_IF,
     )
 
     protection_group = module.params['protection_group']
@@ -231,14 +246,18 @@ def main():
     aci.construct_url(
         root_class=dict(
             aci_class='fabricExplicitGEp',
-            aci_rn='fabric/protpol/expgep-{0}'.format(protection_group),
-            filter_target='eq(fabricExplicitGEp.name, "{0}")'.format(protection_group),
+            aci_rn=f'fabric/protpol/expgep-{protection_group}',
+            filter_target=f'eq(fabricExplicitGEp.name, "{protection_group}")',
             module_object=protection_group,
         ),
-        child_classes=['fabricNodePEp', 'fabricNodePEp', 'fabricRsVpcInstPol'],
+        child_classes=('fabricNodePEp', 'fabricRsVpcInstPol'),
     )
 
-    aci.get_existing()
+    # Skip the existing-object fetch when the caller opts out of
+    # previous/diff output; the APIC POST is an upsert either way
+    no_diff = module.params['no_diff']
+    if not (no_diff and state == 'present'):
+        aci.get_existing()
 
     if state == 'present':
         aci.payload(
@@ -246,22 +265,22 @@ def main():
             class_config=dict(
                 name=protection_group,
                 id=protection_group_id,
-                rn='expgep-{0}'.format(protection_group),
+                rn=f'expgep-{protection_group}',
             ),
             child_configs=[
                 dict(
                     fabricNodePEp=dict(
                         attributes=dict(
-                            id='{0}'.format(switch_1_id),
-                            rn='nodepep-{0}'.format(switch_1_id),
+                            id=f'{switch_1_id}',
+                            rn=f'nodepep-{switch_1_id}',
                         ),
                     ),
                 ),
                 dict(
                     fabricNodePEp=dict(
                         attributes=dict(
-                            id='{0}'.format(switch_2_id),
-                            rn='nodepep-{0}'.format(switch_2_id),
+                            id=f'{switch_2_id}',
+                            rn=f'nodepep-{switch_2_id}',
                         ),
                     ),
                 ),
@@ -275,9 +294,12 @@ def main():
             ],
         )
 
-        aci.get_diff(aci_class='fabricExplicitGEp')
+        if no_diff:
+            aci.post_config(force=True)
+        else:
+            aci.get_diff(aci_class='fabricExplicitGEp')
 
-        aci.post_config()
+            aci.post_config()
 
     elif state == 'absent':
         aci.delete_config()